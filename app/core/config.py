@@ -2,84 +2,162 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import os
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, TypeVar, get_type_hints
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError, validator
 
 from .logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
 
-class WaveformConfig(BaseModel):
+
+def _field(
+    default: Any, *, ge: Optional[float] = None, le: Optional[float] = None, description: str = ""
+) -> Any:
+    """Declare a config field with optional inclusive bounds checked by :func:`_convert`."""
+
+    return field(default=default, metadata={"ge": ge, "le": le, "description": description})
+
+
+@dataclass(frozen=True, slots=True)
+class WaveformConfig:
     """Configuration block for waveform defaults."""
 
-    amplitude: float = Field(0.8, ge=0.0, le=1.2, description="Fraction of full-scale output.")
-    crest_factor_limit: float = Field(6.0, ge=0.0, description="Maximum crest factor in dB.")
-    window: str = Field("hann", description="Default window to apply to generated waveforms.")
+    amplitude: float = _field(0.8, ge=0.0, le=1.2, description="Fraction of full-scale output.")
+    crest_factor_limit: float = _field(6.0, ge=0.0, description="Maximum crest factor in dB.")
+    window: str = _field("hann", description="Default window to apply to generated waveforms.")
 
 
-class TxChannelConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TxChannelConfig:
     """Configuration block describing TX channel defaults and constraints."""
 
     enabled: bool = False
-    center_frequency_hz: float = Field(2.4e9, description="Initial RF center frequency in Hz.")
-    sample_rate_sps: float = Field(30.72e6, ge=1e3, description="Default DAC sample rate.")
-    rf_bandwidth_hz: float = Field(20e6, ge=1e3, description="Analog filter bandwidth in Hz.")
-    gain_db: float = Field(-10.0, ge=-90.0, le=0.0, description="Initial TX attenuation in dB.")
+    center_frequency_hz: float = _field(2.4e9, description="Initial RF center frequency in Hz.")
+    sample_rate_sps: float = _field(30.72e6, ge=1e3, description="Default DAC sample rate.")
+    rf_bandwidth_hz: float = _field(20e6, ge=1e3, description="Analog filter bandwidth in Hz.")
+    gain_db: float = _field(-10.0, ge=-90.0, le=0.0, description="Initial TX attenuation in dB.")
     allow_headroom_overdrive: bool = False
 
-    @validator("rf_bandwidth_hz")
-    def _validate_bandwidth(cls, value: float, values: Dict[str, Any]) -> float:
-        sample_rate = values.get("sample_rate_sps", value)
-        if value > sample_rate:
-            raise ValueError("RF bandwidth must not exceed the sample rate to satisfy Nyquist")
-        return value
-
 
-class LoggingConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
     """Runtime logging configuration."""
 
-    level: str = Field("INFO", description="Default logging level for the application.")
-    log_dir: Path = Field(Path("logs"), description="Directory where log files will be stored.")
-    rotate_megabytes: int = Field(10, ge=1, description="Maximum log file size before rotation.")
-    rotate_backups: int = Field(5, ge=1, description="Number of rotated log files to retain.")
+    level: str = _field("INFO", description="Default logging level for the application.")
+    log_dir: Path = _field(Path("logs"), description="Directory where log files will be stored.")
+    rotate_megabytes: int = _field(10, ge=1, description="Maximum log file size before rotation.")
+    rotate_backups: int = _field(5, ge=1, description="Number of rotated log files to retain.")
 
 
-class DeviceDiscoveryConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DeviceDiscoveryConfig:
     """Configuration values used during device discovery and monitoring."""
 
     usb_enabled: bool = True
     ethernet_enabled: bool = True
-    discovery_interval_s: float = Field(2.0, ge=0.1, description="How frequently to probe for devices.")
-    temperature_poll_interval_s: float = Field(5.0, ge=1.0, description="Temperature polling rate.")
+    discovery_interval_s: float = _field(2.0, ge=0.1, description="How frequently to probe for devices.")
+    temperature_poll_interval_s: float = _field(5.0, ge=1.0, description="Temperature polling rate.")
 
 
-class ProfileConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ProfileConfig:
     """Configuration block for profile persistence."""
 
-    directory: Path = Field(Path("profiles"), description="Directory containing saved profiles.")
-    schema_version: str = Field("1.0", description="Profiles schema version string.")
+    directory: Path = _field(Path("profiles"), description="Directory containing saved profiles.")
+    schema_version: str = _field("1.0", description="Profiles schema version string.")
 
 
-class AppConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AppConfig:
     """Root configuration model for the Pluto+ control application."""
 
-    tx1: TxChannelConfig = Field(default_factory=TxChannelConfig)
-    tx2: TxChannelConfig = Field(default_factory=TxChannelConfig)
-    waveform: WaveformConfig = Field(default_factory=WaveformConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    discovery: DeviceDiscoveryConfig = Field(default_factory=DeviceDiscoveryConfig)
-    profile: ProfileConfig = Field(default_factory=ProfileConfig)
+    tx1: TxChannelConfig = field(default_factory=TxChannelConfig)
+    tx2: TxChannelConfig = field(default_factory=TxChannelConfig)
+    waveform: WaveformConfig = field(default_factory=WaveformConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    discovery: DeviceDiscoveryConfig = field(default_factory=DeviceDiscoveryConfig)
+    profile: ProfileConfig = field(default_factory=ProfileConfig)
     debug: bool = False
+    realtime_tx: bool = False
+
+
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=None)
+def _type_hints(cls: type) -> Dict[str, Any]:
+    return get_type_hints(cls)
+
+
+def _convert(cls: type[_T], data: Mapping[str, Any], prefix: str = "") -> _T:
+    """Build ``cls`` from a plain mapping, coercing scalars and enforcing field bounds.
+
+    Unknown keys are ignored and missing keys fall back to the field defaults.
+
+    Raises:
+        TypeError: When a value cannot be coerced to the declared field type.
+        ValueError: When a value falls outside its declared bounds.
+    """
+
+    hints = _type_hints(cls)
+    kwargs: Dict[str, Any] = {}
+    for item in fields(cls):  # type: ignore[arg-type]
+        if item.name not in data:
+            continue
+        name = prefix + item.name
+        value = _coerce(data[item.name], hints[item.name], name)
+        lower = item.metadata.get("ge")
+        upper = item.metadata.get("le")
+        if lower is not None and value < lower:
+            raise ValueError(f"{name} must be >= {lower}, got {value}")
+        if upper is not None and value > upper:
+            raise ValueError(f"{name} must be <= {upper}, got {value}")
+        kwargs[item.name] = value
+    return cls(**kwargs)
+
+
+def _coerce(value: Any, hint: Any, name: str) -> Any:
+    if is_dataclass(hint):
+        if isinstance(value, hint):
+            return value
+        if isinstance(value, Mapping):
+            return _convert(hint, value, f"{name}.")
+    elif hint is bool:
+        if isinstance(value, bool):
+            return value
+    elif hint is str:
+        if isinstance(value, str):
+            return value
+    elif hint is Path:
+        if isinstance(value, (str, os.PathLike)):
+            return Path(value)
+    elif hint in (int, float) and not isinstance(value, bool):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if hint is float or number.is_integer():
+                return hint(number)
+    expected = "mapping" if is_dataclass(hint) else hint.__name__
+    raise TypeError(f"{name} must be of type {expected}, got {type(value).__name__}")
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    # libyaml decodes UTF-8 itself, so hand it the raw bytes.
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise TypeError(f"Configuration file {path} must contain a mapping at the root level.")
     return data
@@ -88,6 +166,11 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
 def load_config(path: Optional[Path] = None, overrides: Optional[Dict[str, Any]] = None) -> AppConfig:
     """Load the application configuration from disk and apply overrides.
 
+    Parsed configurations are memoised on the file path, its modification time,
+    the overrides, and ``PLUTO_PROFILE_DIR``, so repeated calls skip YAML parsing
+    and validation. The returned instance is shared between callers and must be
+    treated as read-only; use :func:`dataclasses.replace` to derive variants.
+
     Args:
         path: Optional path to a YAML configuration file. When ``None`` the
             ``configs/default.yaml`` file will be used.
@@ -101,39 +184,80 @@ def load_config(path: Optional[Path] = None, overrides: Optional[Dict[str, Any]]
     if path is None:
         path = Path("configs/default.yaml")
 
-    LOGGER.debug("Loading configuration", extra={"path": str(path)})
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Loading configuration", extra={"path": str(path)})
 
+    try:
+        mtime_ns: Optional[int] = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    overrides_key = json.dumps(overrides, sort_keys=True, default=str) if overrides else ""
+    config = _load_config_cached(str(path), mtime_ns, overrides_key, os.getenv("PLUTO_PROFILE_DIR"))
+
+    _ensure_directories(config)
+    return config
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    path_str: str, mtime_ns: Optional[int], overrides_key: str, env_profile_dir: Optional[str]
+) -> AppConfig:
+    # ``mtime_ns`` only participates in the cache key so edits to the file invalidate it.
+    path = Path(path_str)
     config_dict: Dict[str, Any] = {}
-    if path.exists():
+    try:
         config_dict = _load_yaml(path)
-    else:
+    except FileNotFoundError:
         LOGGER.warning("Configuration file not found, falling back to defaults", extra={"path": str(path)})
 
-    if overrides:
-        config_dict = _deep_merge(config_dict, overrides)
+    if overrides_key:
+        config_dict = _deep_merge(config_dict, json.loads(overrides_key))
 
-    env_profile_dir = os.getenv("PLUTO_PROFILE_DIR")
     if env_profile_dir:
         config_dict.setdefault("profile", {})["directory"] = env_profile_dir
 
     try:
-        config = AppConfig.model_validate(config_dict)
-    except ValidationError as exc:
+        config = _convert(AppConfig, config_dict)
+        _check_invariants(config)
+    except (TypeError, ValueError) as exc:
         LOGGER.error("Configuration validation failed: %s", exc)
         raise
-
-    _ensure_directories(config)
     return config
 
 
+def _check_invariants(config: AppConfig) -> None:
+    """Validate cross-field constraints once the whole tree has been converted."""
+
+    for name, channel in (("tx1", config.tx1), ("tx2", config.tx2)):
+        if channel.rf_bandwidth_hz > channel.sample_rate_sps:
+            raise ValueError(f"{name}: RF bandwidth must not exceed the sample rate to satisfy Nyquist")
+
+
 def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    result = dict(base)
-    for key, value in overrides.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    """Merge ``overrides`` into ``base`` in place and return ``base``.
+
+    Nested mappings are walked with an explicit stack instead of recursion so no
+    intermediate dictionaries are allocated. Both arguments must be owned by the
+    caller since ``base`` is mutated and may end up sharing values with ``overrides``.
+    """
+
+    if not overrides:
+        return base
+    stack = [(base, overrides)]
+    while stack:
+        target, source = stack.pop()
+        if not target:
+            # Nothing to merge against: bulk-copy through the C-level dict merge.
+            target.update(source)
+            continue
+        assign = target.__setitem__
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                assign(key, value)
+    return base
 
 
 def _ensure_directories(config: AppConfig) -> None:
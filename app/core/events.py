@@ -2,39 +2,75 @@
 
 from __future__ import annotations
 
+import logging
+import sys
 import threading
-from collections import defaultdict
-from typing import Callable, DefaultDict, Dict, List
+from typing import Callable, Dict, Tuple
 
 from .logger import get_logger
 
 LOGGER = get_logger(__name__)
 Callback = Callable[..., None]
 
+# Well-known event names. They are interned so the snapshot keys and the names
+# publishers pass in are the same objects and dict lookups hit the identity check.
+RX_SPECTRUM = sys.intern("rx:spectrum")
+WAVEFORM_WARNING = sys.intern("waveform:warning")
+DISCOVERY_UPDATE = sys.intern("discovery:update")
+DEVICE_CONNECTED = sys.intern("device:connected")
+DEVICE_DISCONNECTED = sys.intern("device:disconnected")
+
+
+def tx_event(channel: str, state: str) -> str:
+    """Return the interned ``tx:<channel>:<state>`` event name."""
+
+    return sys.intern(f"tx:{channel}:{state}")
+
 
 class EventBus:
-    """Simple event emitter with subscription support."""
+    """Simple event emitter with subscription support.
+
+    Subscriptions live in an immutable ``event -> tuple`` snapshot that writers
+    rebuild and swap under a lock; publishers read the current snapshot with a
+    single attribute load, so the publish path takes no lock and copies nothing.
+    """
 
     def __init__(self) -> None:
-        self._callbacks: DefaultDict[str, List[Callback]] = defaultdict(list)
-        self._lock = threading.Lock()
+        self._snapshot: Dict[str, Tuple[Callback, ...]] = {}
+        self._write_lock = threading.Lock()
 
     def subscribe(self, event: str, callback: Callback) -> None:
-        with self._lock:
-            self._callbacks[event].append(callback)
-            LOGGER.debug("Subscribed callback", extra={"event": event, "count": len(self._callbacks[event])})
+        event = sys.intern(event)
+        with self._write_lock:
+            callbacks = self._snapshot.get(event, ()) + (callback,)
+            self._snapshot = {**self._snapshot, event: callbacks}
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Subscribed callback", extra={"event": event, "count": len(callbacks)})
 
     def unsubscribe(self, event: str, callback: Callback) -> None:
-        with self._lock:
+        with self._write_lock:
+            callbacks = list(self._snapshot.get(event, ()))
             try:
-                self._callbacks[event].remove(callback)
+                callbacks.remove(callback)
             except ValueError:
-                LOGGER.debug("Callback not registered", extra={"event": event})
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug("Callback not registered", extra={"event": event})
+                return
+            snapshot = dict(self._snapshot)
+            if callbacks:
+                snapshot[event] = tuple(callbacks)
+            else:
+                del snapshot[event]
+            self._snapshot = snapshot
 
     def publish(self, event: str, *args, **kwargs) -> None:
-        with self._lock:
-            callbacks = list(self._callbacks[event])
-        for callback in callbacks:
+        """Invoke every callback subscribed to ``event`` with the given arguments.
+
+        The positional and keyword payload is built once per publish and handed to
+        each callback by reference; callbacks must treat it as read-only.
+        """
+
+        for callback in self._snapshot.get(event, ()):
             try:
                 callback(*args, **kwargs)
             except Exception:  # pragma: no cover
@@ -44,4 +80,13 @@ class EventBus:
 GLOBAL_BUS = EventBus()
 
 
-__all__ = ["EventBus", "GLOBAL_BUS"]
+__all__ = [
+    "DEVICE_CONNECTED",
+    "DEVICE_DISCONNECTED",
+    "DISCOVERY_UPDATE",
+    "EventBus",
+    "GLOBAL_BUS",
+    "RX_SPECTRUM",
+    "WAVEFORM_WARNING",
+    "tx_event",
+]
@@ -2,14 +2,59 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
+import time
+from collections import deque
 from pathlib import Path
-from queue import Queue
-from typing import Optional
-
-_LOGGER_CACHE: dict[str, logging.Logger] = {}
-_GUI_QUEUE: Optional[Queue[logging.LogRecord]] = None
+from queue import Queue, SimpleQueue
+from typing import Deque, Optional
+
+# Records retained for the GUI console; the oldest are dropped once it is full.
+GUI_LOG_CAPACITY = 10_000
+
+_GUI_QUEUE: Optional[Deque[logging.LogRecord]] = None
+_LOG_QUEUE: SimpleQueue[logging.LogRecord] = SimpleQueue()
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` once per second and only appends the millis.
+
+    The output matches :class:`logging.Formatter`; the cache is unsynchronised, so
+    an instance must only be used from one thread (the queue listener).
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._cached_second = -1
+        self._cached_text = ""
+
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_text, record.msecs)
+
+
+_FILE_FORMATTER = _SecondCachedFormatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+_GUI_FORMATTER = logging.Formatter("%(levelname)s | %(name)s | %(message)s")
+_MESSAGE_FORMATTER = logging.Formatter("%(message)s")
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 class QueueHandler(logging.Handler):
@@ -26,8 +71,35 @@ class QueueHandler(logging.Handler):
             pass
 
 
-def configure_logging(level: str, log_dir: Path, rotate_megabytes: int, rotate_backups: int) -> None:
-    """Configure global logging handlers."""
+class DequeHandler(logging.Handler):
+    """Handler appending records to a bounded deque drained by a single consumer.
+
+    ``deque.append`` and ``popleft`` are atomic, so the one producer (the logging
+    listener) and the one consumer (the GUI timer) need no lock, and a full deque
+    drops its oldest record instead of blocking the producer.
+    """
+
+    def __init__(self, records: Deque[logging.LogRecord]):
+        super().__init__()
+        self.records = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def configure_logging(
+    level: str, log_dir: Path, rotate_megabytes: int, rotate_backups: int
+) -> logging.handlers.QueueListener:
+    """Configure global logging handlers.
+
+    The root logger only enqueues records; a background
+    :class:`logging.handlers.QueueListener` formats them and performs the file and
+    GUI I/O so logging never blocks the calling thread on disk writes. The listener
+    is returned for inspection; stop it only through :func:`shutdown_logging`, which
+    also runs at exit, never by calling its ``stop()`` directly.
+    """
+
+    global _LISTENER
 
     log_dir.mkdir(parents=True, exist_ok=True)
     logfile = log_dir / "pluto_plus.log"
@@ -36,32 +108,73 @@ def configure_logging(level: str, log_dir: Path, rotate_megabytes: int, rotate_b
     file_handler = logging.handlers.RotatingFileHandler(
         logfile, maxBytes=rotate_megabytes * 1024 * 1024, backupCount=rotate_backups, encoding="utf-8"
     )
-    file_handler.setFormatter(
-        logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
-    )
+    file_handler.setFormatter(_FILE_FORMATTER)
     handlers.append(file_handler)
 
     if _GUI_QUEUE is not None:
-        queue_handler = QueueHandler(_GUI_QUEUE)
-        queue_handler.setFormatter(logging.Formatter("%(levelname)s | %(name)s | %(message)s"))
-        handlers.append(queue_handler)
+        gui_handler = DequeHandler(_GUI_QUEUE)
+        gui_handler.setFormatter(_GUI_FORMATTER)
+        handlers.append(gui_handler)
+
+    shutdown_logging()
+    _LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+
+    # The enqueued record's message is pre-rendered; the listener's handlers add the layout.
+    enqueue_handler = logging.handlers.QueueHandler(_LOG_QUEUE)
+    enqueue_handler.setFormatter(_MESSAGE_FORMATTER)
+    logging.basicConfig(
+        level=_LEVEL_MAP.get(level.upper(), logging.INFO), handlers=[enqueue_handler], force=True
+    )
+    return _LISTENER
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and close the handlers owned by the active listener.
+
+    Safe to call repeatedly: the listener is detached before it is stopped, so a
+    second call finds nothing to stop.
+    """
+
+    global _LISTENER
 
-    logging.basicConfig(level=getattr(logging, level.upper(), logging.INFO), handlers=handlers)
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Get a module-level logger with caching."""
+    """Get a module-level logger; :func:`logging.getLogger` already memoises by name."""
+
+    return logging.getLogger(name)
+
+
+def make_gui_queue() -> Deque[logging.LogRecord]:
+    """Return an empty bounded record buffer for :func:`set_gui_queue`."""
 
-    if name not in _LOGGER_CACHE:
-        _LOGGER_CACHE[name] = logging.getLogger(name)
-    return _LOGGER_CACHE[name]
+    return deque(maxlen=GUI_LOG_CAPACITY)
 
 
-def set_gui_queue(queue: Queue[logging.LogRecord]) -> None:
-    """Install a queue that mirrors log records to the GUI console."""
+def set_gui_queue(queue: Deque[logging.LogRecord]) -> None:
+    """Install a bounded deque that mirrors log records to the GUI console."""
 
     global _GUI_QUEUE
     _GUI_QUEUE = queue
 
 
-__all__ = ["configure_logging", "get_logger", "set_gui_queue", "QueueHandler"]
+__all__ = [
+    "configure_logging",
+    "get_logger",
+    "make_gui_queue",
+    "set_gui_queue",
+    "shutdown_logging",
+    "DequeHandler",
+    "GUI_LOG_CAPACITY",
+    "QueueHandler",
+]
@@ -0,0 +1,49 @@
+"""Best-effort real-time scheduling helpers for latency-sensitive worker threads."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from .logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Mid-range SCHED_FIFO priority: above normal threads, below kernel IRQ threads.
+_FIFO_PRIORITY = 50
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+
+
+def boost_current_thread() -> bool:
+    """Raise the calling thread's scheduling priority and return whether it worked.
+
+    Uses ``THREAD_PRIORITY_TIME_CRITICAL`` on Windows and ``SCHED_FIFO`` on Linux.
+    Both usually need elevated privileges; failures are logged and ignored so the
+    thread keeps running at normal priority.
+    """
+
+    try:
+        if sys.platform == "win32":  # pragma: no cover - platform specific
+            import ctypes
+
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            handle = kernel32.GetCurrentThread()
+            if kernel32.SetThreadPriority(handle, _THREAD_PRIORITY_TIME_CRITICAL):
+                return True
+            LOGGER.warning(
+                "Real-time thread priority unavailable",
+                extra={"error": f"SetThreadPriority failed (error {ctypes.get_last_error()})"},
+            )
+            return False
+        if hasattr(os, "sched_setscheduler"):
+            # On Linux pid 0 addresses the calling thread, not the whole process.
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_FIFO_PRIORITY))
+            return True
+    except (OSError, AttributeError) as exc:
+        LOGGER.warning("Real-time thread priority unavailable", extra={"error": str(exc)})
+        return False
+    LOGGER.warning("Real-time thread priority unsupported", extra={"platform": sys.platform})
+    return False
+
+
+__all__ = ["boost_current_thread"]
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Literal, Optional
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DeviceConn:
     """Represents a connection descriptor for a Pluto+ device."""
 
@@ -18,7 +18,7 @@ class DeviceConn:
     external_ref: Optional[bool] = None
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class WaveformSpec:
     """Description of a generated or imported waveform."""
 
@@ -41,7 +41,7 @@ class WaveformSpec:
     metadata: dict[str, float | int | str] = field(default_factory=dict)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class TxConfig:
     """Configuration for a TX pipeline."""
 
@@ -6,7 +6,9 @@ import math
 import signal
 import sys
 from contextlib import contextmanager
-from typing import Callable, Iterable, Iterator
+from typing import Callable, Iterable, Iterator, TypeVar, Union
+
+import numpy as np
 
 from .logger import get_logger
 
@@ -29,11 +31,30 @@ def nyquist_check(sample_rate: float, bandwidth: float) -> bool:
     return valid
 
 
-def db_to_linear(value_db: float) -> float:
+_Value = TypeVar("_Value", bound=Union[float, np.ndarray])
+
+
+def db_to_linear(value_db: _Value) -> _Value:
+    """Convert amplitude decibels to a linear ratio; arrays are converted element-wise."""
+
+    if isinstance(value_db, np.ndarray):
+        out = np.multiply(value_db, 1.0 / 20.0)
+        return np.power(10.0, out, out=out)
     return 10 ** (value_db / 20.0)
 
 
-def linear_to_db(value_linear: float) -> float:
+def linear_to_db(value_linear: _Value) -> _Value:
+    """Convert a linear amplitude ratio to decibels; arrays are converted element-wise.
+
+    Values are floored at ``1e-12`` (-240 dB) so zeros do not produce ``-inf``. Array
+    inputs are never modified; the result is computed in a single new buffer.
+    """
+
+    if isinstance(value_linear, np.ndarray):
+        out = np.maximum(value_linear, 1e-12)
+        np.log10(out, out=out)
+        out *= 20.0
+        return out
     return 20.0 * math.log10(max(value_linear, 1e-12))
 
 
@@ -68,6 +89,24 @@ def ensure_safe_amplitude(amplitude: float, safe_limit: float = 0.8) -> tuple[fl
     return safe_limit, True
 
 
+def ensure_safe_amplitude_array(buffer: np.ndarray, safe_limit: float = 0.8) -> tuple[np.ndarray, bool]:
+    """Clamp a real-valued amplitude buffer in place and report whether clipping occurred.
+
+    The buffer is scanned once for its peak and only rewritten when it exceeds
+    ``safe_limit``; a single warning is logged for the whole buffer.
+    """
+
+    if buffer.size == 0:
+        return buffer, False
+    # Compare in the buffer's dtype so an already-clamped float32 buffer reads as safe.
+    peak = buffer.max()
+    if peak <= safe_limit:
+        return buffer, False
+    np.minimum(buffer, safe_limit, out=buffer)
+    LOGGER.warning("Amplitude exceeds safe limit", extra={"amplitude": float(peak), "limit": safe_limit})
+    return buffer, True
+
+
 def install_excepthook() -> None:
     """Install a verbose exception hook for debug sessions."""
 
@@ -106,6 +145,7 @@ __all__ = [
     "graceful_shutdown",
     "clamp",
     "ensure_safe_amplitude",
+    "ensure_safe_amplitude_array",
     "install_excepthook",
     "run_with_timeout",
 ]
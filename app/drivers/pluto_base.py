@@ -39,6 +39,16 @@ class PlutoBase(abc.ABC):
     def stop_tx(self, channel: str) -> None:
         """Stop transmission on ``channel``."""
 
+    def tx_block_size(self, channel: str) -> int:
+        """Return the sample multiple TX buffers for ``channel`` should be padded to.
+
+        The default of 1 means no padding: TX buffers are cyclic, so padding inserts
+        a gap of silence every period. Drivers whose DMA needs aligned buffers can
+        override this.
+        """
+
+        return 1
+
     def capture_rx(self, duration_s: float, sample_rate: float) -> np.ndarray:
         """Optional RX capture for monitoring; default raises ``NotImplementedError``."""
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 
@@ -25,6 +27,8 @@ class PlutoMockDriver(PlutoBase):
         self._connected = False
         self._tx_buffers: Dict[str, np.ndarray] = {}
         self._recordings: Dict[str, Path] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mock-recorder")
+        self._pending_saves: List[Future] = []
 
     def connect(self, uri: str, timeout_s: float = 5.0) -> DeviceConn:
         LOGGER.info("Mock connect", extra={"uri": uri})
@@ -33,6 +37,7 @@ class PlutoMockDriver(PlutoBase):
 
     def disconnect(self) -> None:
         LOGGER.info("Mock disconnect")
+        self._flush_recordings()
         self._connected = False
 
     def query_capabilities(self) -> dict[str, float | str | bool]:
@@ -50,11 +55,12 @@ class PlutoMockDriver(PlutoBase):
     def start_tx(self, channel: str, iq: np.ndarray) -> None:
         self._ensure_connected()
         LOGGER.info("Mock start TX", extra={"channel": channel, "samples": len(iq)})
-        self._tx_buffers[channel] = np.array(iq, dtype=np.complex64)
+        buffer = np.ascontiguousarray(iq, dtype=np.complex64)
+        self._tx_buffers[channel] = buffer
         if self._recordings.get(channel):
-            path = self._recordings[channel]
-            path.parent.mkdir(parents=True, exist_ok=True)
-            np.save(path, self._tx_buffers[channel])
+            # Recording is written in the background so TX start never waits on disk I/O.
+            self._pending_saves = [future for future in self._pending_saves if not future.done()]
+            self._pending_saves.append(self._writer.submit(_save_recording, self._recordings[channel], buffer))
 
     def stop_tx(self, channel: str) -> None:
         self._ensure_connected()
@@ -66,9 +72,7 @@ class PlutoMockDriver(PlutoBase):
         LOGGER.info(
             "Mock capture RX", extra={"duration_s": duration_s, "sample_rate": sample_rate, "samples": num_samples}
         )
-        t = np.arange(num_samples) / sample_rate
-        iq = 0.8 * np.exp(1j * 2 * np.pi * 1e6 * t)
-        return iq.astype(np.complex64)
+        return _simulated_tone(num_samples, sample_rate)
 
     def read_temperature(self) -> float:
         return 30.0 + 5.0 * np.sin(time.time() / 60.0)
@@ -80,9 +84,34 @@ class PlutoMockDriver(PlutoBase):
     def configure_recording(self, channel: str, path: Path) -> None:
         self._recordings[channel] = path
 
+    def _flush_recordings(self) -> None:
+        pending, self._pending_saves = self._pending_saves, []
+        wait(pending)
+        for future in pending:
+            if future.exception() is not None:
+                LOGGER.error("Failed to save TX recording", exc_info=future.exception())
+
     def _ensure_connected(self) -> None:
         if not self._connected:
             raise RuntimeError("Mock driver not connected")
 
 
+def _save_recording(path: Path, buffer: np.ndarray) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, buffer, allow_pickle=False)
+
+
+@lru_cache(maxsize=8)
+def _simulated_tone(num_samples: int, sample_rate: float) -> np.ndarray:
+    """Return a read-only 1 MHz tone at 0.8 FS, shared by every capture of that shape."""
+
+    phase = np.arange(num_samples) * (2 * np.pi * 1e6 / sample_rate)
+    tone = np.empty(num_samples, dtype=np.complex64)
+    tone.real = np.cos(phase)
+    tone.imag = np.sin(phase)
+    tone *= 0.8
+    tone.flags.writeable = False
+    return tone
+
+
 __all__ = ["PlutoMockDriver"]
@@ -85,7 +85,7 @@ class PlutoPlusDriver(PlutoBase):
         tx_attr.dds_single_tone(scale=0, freq=0)
         tx_attr.tx_cyclic_buffer = True
         tx_attr.tx_destroy_buffer()
-        tx_attr.tx(iq.astype(np.complex64).tolist())
+        tx_attr.tx(np.ascontiguousarray(iq, dtype=np.complex64))
 
     def stop_tx(self, channel: str) -> None:
         if not self._device:
@@ -3,58 +3,207 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 from scipy.io import wavfile
 
 from app.core.logger import get_logger
 
+try:  # pragma: no cover - optional dependency
+    import pandas as pd
+except ImportError:  # pragma: no cover - falls back to numpy's parser
+    pd = None
+
 LOGGER = get_logger(__name__)
 
 
-SUPPORTED_EXTS = {".npy", ".c8", ".wav", ".csv"}
+IQLoader = Callable[[Path], Tuple[np.ndarray, Optional[float]]]
+IQSaver = Callable[[Path, np.ndarray, Optional[float]], None]
+IQChunkWriter = Callable[[Path, Iterable[np.ndarray], int], int]
 
 
 def load_iq(path: Path) -> Tuple[np.ndarray, float | None]:
-    """Load IQ samples from ``path`` and optionally return their sample rate."""
+    """Load IQ samples from ``path`` and optionally return their sample rate.
+
+    Samples are returned as a C-contiguous ``complex64`` array. ``.c8`` files and
+    ``complex64`` ``.npy`` files are memory-mapped read-only rather than read into
+    RAM, so pages are streamed from the OS cache on demand; callers must not
+    modify the returned array in place. The file stays mapped for as long as the
+    array (or any view of it) is referenced, which on Windows blocks overwriting
+    or deleting it; copy the samples if the file must be released.
+    """
 
     suffix = path.suffix.lower()
-    if suffix == ".npy":
-        return np.load(path), None
-    if suffix == ".c8":
-        data = np.fromfile(path, dtype=np.complex64)
-        return data, None
-    if suffix == ".csv":
-        data = np.loadtxt(path, delimiter=",", dtype=float)
-        iq = data[:, 0] + 1j * data[:, 1]
-        return iq.astype(np.complex64), None
-    if suffix == ".wav":
-        rate, samples = wavfile.read(path)
-        samples = samples.astype(np.float32) / np.iinfo(samples.dtype).max
-        iq = samples[:, 0] + 1j * samples[:, 1]
-        return iq, float(rate)
-    raise ValueError(f"Unsupported IQ format: {suffix}")
+    try:
+        loader = _LOADERS[suffix]
+    except KeyError:
+        raise ValueError(f"Unsupported IQ format: {suffix}") from None
+    return loader(path)
 
 
 def save_iq(path: Path, iq: np.ndarray, sample_rate: float | None = None) -> None:
     suffix = path.suffix.lower()
+    try:
+        saver = _SAVERS[suffix]
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {suffix}") from None
     path.parent.mkdir(parents=True, exist_ok=True)
-    if suffix == ".npy":
-        np.save(path, iq)
-    elif suffix == ".c8":
-        iq.astype(np.complex64).tofile(path)
-    elif suffix == ".csv":
-        np.savetxt(path, np.column_stack((iq.real, iq.imag)), delimiter=",")
-    elif suffix == ".wav":
-        if sample_rate is None:
-            raise ValueError("Sample rate required for WAV export")
-        scaled = np.column_stack((iq.real, iq.imag))
-        scaled = np.clip(scaled, -1.0, 1.0)
-        wavfile.write(path, int(sample_rate), (scaled * 32767).astype(np.int16))
-    else:
-        raise ValueError(f"Unsupported export format: {suffix}")
+    saver(path, iq, sample_rate)
     LOGGER.info("Saved IQ", extra={"path": str(path), "samples": len(iq)})
 
 
-__all__ = ["load_iq", "save_iq", "SUPPORTED_EXTS"]
+def save_iq_chunks(
+    path: Path, chunks: Iterable[np.ndarray], num_samples: int, sample_rate: float | None = None
+) -> None:
+    """Save ``num_samples`` IQ samples that arrive as consecutive ``chunks``.
+
+    ``.npy``, ``.c8`` and ``.csv`` files are written chunk by chunk, so the whole
+    waveform is never held in memory; formats whose writers need the complete
+    array (``.wav``) are gathered first and handed to :func:`save_iq`.
+
+    Raises:
+        ValueError: For an unsupported format, or when the chunks do not add up to
+            ``num_samples``; the partially written file is removed first.
+    """
+
+    suffix = path.suffix.lower()
+    writer = _CHUNK_WRITERS.get(suffix)
+    if writer is None:
+        gathered = [np.asarray(chunk, dtype=np.complex64) for chunk in chunks]
+        iq = np.concatenate(gathered) if gathered else np.empty(0, dtype=np.complex64)
+        if len(iq) != num_samples:
+            raise ValueError(f"Expected {num_samples} samples, got {len(iq)}")
+        save_iq(path, iq, sample_rate)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        written = writer(path, chunks, num_samples)
+        if written != num_samples:
+            raise ValueError(f"Expected {num_samples} samples, got {written}")
+    except BaseException:
+        # Never leave a truncated or zero-padded file that looks like a good export.
+        path.unlink(missing_ok=True)
+        raise
+    LOGGER.info("Saved IQ", extra={"path": str(path), "samples": written})
+
+
+def _load_npy(path: Path) -> Tuple[np.ndarray, Optional[float]]:
+    return np.ascontiguousarray(np.load(path, mmap_mode="r"), dtype=np.complex64), None
+
+
+def _load_c8(path: Path) -> Tuple[np.ndarray, Optional[float]]:
+    # ``np.memmap`` refuses zero-length files, so hand back an empty array instead.
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=np.complex64), None
+    # A plain ndarray view, matching _load_npy, rather than the np.memmap subclass.
+    return np.asarray(np.memmap(path, dtype=np.complex64, mode="r")), None
+
+
+def _load_csv(path: Path) -> Tuple[np.ndarray, Optional[float]]:
+    # Parse straight into float32 I/Q pairs and reinterpret them as complex64.
+    if pd is not None:
+        frame = pd.read_csv(path, header=None, usecols=[0, 1], dtype=np.float32, engine="c")
+        pairs = frame.to_numpy(dtype=np.float32)
+    else:
+        pairs = np.loadtxt(path, delimiter=",", dtype=np.float32, usecols=(0, 1), ndmin=2)
+    return np.ascontiguousarray(pairs).view(np.complex64).reshape(-1), None
+
+
+def _load_wav(path: Path) -> Tuple[np.ndarray, Optional[float]]:
+    rate, samples = wavfile.read(path)
+    if samples.ndim != 2 or samples.shape[1] != 2:
+        raise ValueError(f"WAV IQ files must have exactly two channels (I and Q): {path}")
+    try:
+        scale = _WAV_SCALES[samples.dtype]
+    except KeyError:
+        raise ValueError(f"Unsupported WAV sample format {samples.dtype}: {path}") from None
+    # One cast into contiguous float32 pairs, scaled in place, then viewed as complex64.
+    pairs = samples.astype(np.float32)
+    if scale != 1.0:
+        pairs *= scale
+    return pairs.view(np.complex64).reshape(-1), float(rate)
+
+
+def _save_npy(path: Path, iq: np.ndarray, sample_rate: Optional[float]) -> None:
+    np.save(path, iq)
+
+
+def _save_c8(path: Path, iq: np.ndarray, sample_rate: Optional[float]) -> None:
+    np.ascontiguousarray(iq, dtype=np.complex64).tofile(path)
+
+
+def _save_csv(path: Path, iq: np.ndarray, sample_rate: Optional[float]) -> None:
+    pairs = np.ascontiguousarray(iq, dtype=np.complex64).view(np.float32).reshape(-1, 2)
+    np.savetxt(path, pairs, delimiter=",", fmt="%.8g")
+
+
+def _save_wav(path: Path, iq: np.ndarray, sample_rate: Optional[float]) -> None:
+    if sample_rate is None:
+        raise ValueError("Sample rate required for WAV export")
+    # Clip into one float32 (N, 2) buffer, then scale and round it in place before the cast.
+    # The scale mirrors the loader's 1/32768, so +1.0 saturates at 32767.
+    pairs = np.ascontiguousarray(iq, dtype=np.complex64).view(np.float32).reshape(-1, 2)
+    scaled = np.clip(pairs, -1.0, 1.0)
+    scaled *= 32768.0
+    np.rint(scaled, out=scaled)
+    np.minimum(scaled, 32767.0, out=scaled)
+    wavfile.write(path, int(sample_rate), scaled.astype(np.int16))
+
+
+def _write_npy_chunks(path: Path, chunks: Iterable[np.ndarray], num_samples: int) -> int:
+    # The header needs the final shape, so map the file at full size and fill it in order.
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.complex64, shape=(num_samples,))
+    written = 0
+    try:
+        for chunk in chunks:
+            stop = written + len(chunk)
+            if stop > num_samples:
+                raise ValueError(f"Expected {num_samples} samples, got at least {stop}")
+            out[written:stop] = chunk
+            written = stop
+        out.flush()
+    finally:
+        del out
+    return written
+
+
+def _write_c8_chunks(path: Path, chunks: Iterable[np.ndarray], num_samples: int) -> int:
+    written = 0
+    with open(path, "wb") as handle:
+        for chunk in chunks:
+            np.ascontiguousarray(chunk, dtype=np.complex64).tofile(handle)
+            written += len(chunk)
+    return written
+
+
+def _write_csv_chunks(path: Path, chunks: Iterable[np.ndarray], num_samples: int) -> int:
+    written = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        for chunk in chunks:
+            pairs = np.ascontiguousarray(chunk, dtype=np.complex64).view(np.float32).reshape(-1, 2)
+            np.savetxt(handle, pairs, delimiter=",", fmt="%.8g")
+            written += len(chunk)
+    return written
+
+
+# Multipliers mapping each WAV sample format onto [-1, 1).
+_WAV_SCALES: Dict[np.dtype, np.float32] = {
+    np.dtype(np.int16): np.float32(1.0 / 32768.0),
+    np.dtype(np.int32): np.float32(1.0 / 2147483648.0),
+    np.dtype(np.float32): np.float32(1.0),
+    np.dtype(np.float64): np.float32(1.0),
+}
+
+_LOADERS: Dict[str, IQLoader] = {".npy": _load_npy, ".c8": _load_c8, ".csv": _load_csv, ".wav": _load_wav}
+_SAVERS: Dict[str, IQSaver] = {".npy": _save_npy, ".c8": _save_c8, ".csv": _save_csv, ".wav": _save_wav}
+_CHUNK_WRITERS: Dict[str, IQChunkWriter] = {
+    ".npy": _write_npy_chunks,
+    ".c8": _write_c8_chunks,
+    ".csv": _write_csv_chunks,
+}
+
+SUPPORTED_EXTS = set(_LOADERS)
+
+
+__all__ = ["load_iq", "save_iq", "save_iq_chunks", "SUPPORTED_EXTS"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from functools import lru_cache
 
 import numpy as np
 from scipy import signal
@@ -11,6 +13,25 @@ from app.core.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Inputs above this many samples filter I and Q on separate threads; SciPy's
+# polyphase kernel releases the GIL, so the two halves genuinely overlap.
+_PARALLEL_MIN_SAMPLES = 1 << 15
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resample")
+
+
+@lru_cache(maxsize=32)
+def _design_filter(up: int, down: int) -> np.ndarray:
+    """Return the anti-aliasing FIR ``resample_poly`` would design for ``up/down``.
+
+    Same length, cutoff and Kaiser window as SciPy's default; ``resample_poly``
+    applies the ``up`` gain itself when handed the taps.
+    """
+
+    max_rate = max(up, down)
+    taps = signal.firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    taps.flags.writeable = False
+    return taps
+
 
 def rational_resample(iq: np.ndarray, input_rate: float, output_rate: float) -> np.ndarray:
     """Resample IQ data using a rational approximation of the rate change."""
@@ -18,13 +39,24 @@ def rational_resample(iq: np.ndarray, input_rate: float, output_rate: float) ->
     if input_rate == output_rate:
         return iq
 
-    frac = Fraction(output_rate, input_rate).limit_denominator(1024)
+    frac = (Fraction(output_rate) / Fraction(input_rate)).limit_denominator(1024)
+    if frac == 1:
+        return np.asarray(iq, dtype=np.complex64)
     LOGGER.info(
         "Resampling IQ",
         extra={"input_rate": input_rate, "output_rate": output_rate, "up": frac.numerator, "down": frac.denominator},
     )
-    resampled = signal.resample_poly(iq, frac.numerator, frac.denominator)
-    return resampled.astype(np.complex64)
+    up, down = frac.numerator, frac.denominator
+    taps = _design_filter(up, down)
+    if np.iscomplexobj(iq) and iq.size > _PARALLEL_MIN_SAMPLES:
+        imag = _EXECUTOR.submit(signal.resample_poly, iq.imag, up, down, window=taps)
+        real = signal.resample_poly(iq.real, up, down, window=taps)
+        resampled = np.empty(real.shape, dtype=np.complex64)
+        resampled.real = real
+        resampled.imag = imag.result()
+        return resampled
+    resampled = signal.resample_poly(iq, up, down, window=taps)
+    return resampled.astype(np.complex64, copy=False)
 
 
 __all__ = ["rational_resample"]
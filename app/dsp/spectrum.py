@@ -2,18 +2,105 @@
 
 from __future__ import annotations
 
+import logging
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import numpy as np
+from scipy import fft as sp_fft
 
 from app.core.logger import get_logger
-from app.core.utils import linear_to_db
 
 LOGGER = get_logger(__name__)
 
+# 10*log10(x) == _DB_PER_OCTAVE * log2(x); log2 is the cheaper transcendental.
+_DB_PER_OCTAVE = 10.0 / math.log2(10.0)
 
-@dataclass
+
+@lru_cache(maxsize=8)
+def _hann(size: int) -> np.ndarray:
+    # float32 so windowing complex64 frames stays in single precision.
+    window = np.hanning(size).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=8)
+def _shifted_freqs(size: int, sample_rate: float) -> np.ndarray:
+    freqs = sp_fft.fftshift(sp_fft.fftfreq(size, 1 / sample_rate))
+    freqs.flags.writeable = False
+    return freqs
+
+
+@lru_cache(maxsize=8)
+def _rfft_freqs(size: int, sample_rate: float) -> np.ndarray:
+    freqs = sp_fft.rfftfreq(size, 1 / sample_rate)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def magnitude_squared(values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return ``|values|**2`` as a real array of the matching precision.
+
+    Complex input goes through NumPy's vectorised ``abs`` and is squared in place,
+    which is several times faster than summing ``re**2 + im**2`` and agrees with it
+    to float rounding. When ``out`` is given the result is written there instead of
+    a new array.
+    """
+
+    values = np.ascontiguousarray(values).reshape(-1)
+    if not np.iscomplexobj(values):
+        return np.square(values, out=out)
+    if out is None:
+        out = np.empty(values.shape, dtype=values.real.dtype)
+    np.abs(values, out=out)
+    return np.multiply(out, out, out=out)
+
+
+def power_to_db(power: np.ndarray, floor: float = 1e-24) -> np.ndarray:
+    """Convert a real power array (``|z|**2``) to dB in place and return it.
+
+    Values are floored at ``floor`` first. The power form skips the square root an
+    amplitude ``20*log10(|z|)`` needs, and the log is taken as a scaled ``log2``.
+    """
+
+    np.maximum(power, floor, out=power)
+    np.log2(power, out=power)
+    power *= _DB_PER_OCTAVE
+    return power
+
+
+def _shifted_power(spectrum: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return ``fftshift(|spectrum|**2)``, writing each half straight into place.
+
+    Shifting the real power instead of the complex FFT moves half the bytes, and
+    writing the halves to their shifted positions avoids the shift copy entirely.
+    """
+
+    size = spectrum.size
+    half = size // 2
+    power = np.empty(size, dtype=spectrum.real.dtype) if out is None else out
+    magnitude_squared(spectrum[size - half :], out=power[:half])
+    magnitude_squared(spectrum[: size - half], out=power[half:])
+    return power
+
+
+def _relative_power_db(power: np.ndarray) -> np.ndarray:
+    """Convert ``power`` in place to dB relative to its peak, floored at -240 dB.
+
+    Normalising by subtracting in the dB domain keeps the whole conversion to
+    in-place passes over the one buffer instead of a divide into a new array.
+    """
+
+    peak = float(power.max())
+    power_to_db(power, peak * 1e-24 if peak > 0.0 else 1e-24)
+    power -= power.max()
+    return power
+
+
+@dataclass(frozen=True, slots=True)
 class SpectrumResult:
     freqs: np.ndarray
     magnitude_db: np.ndarray
@@ -32,34 +119,93 @@ class SpectrumAnalyzer:
         self._avg_buffer: Optional[np.ndarray] = None
         self._peak_buffer: Optional[np.ndarray] = None
         self._count = 0
+        # Scratch reused across frames so steady-state processing does not allocate
+        # per-frame buffers; reallocated only when the frame count or input kind changes.
+        self._frames: Optional[np.ndarray] = None
+        self._power: Optional[np.ndarray] = None
 
     def process(self, iq: np.ndarray) -> SpectrumResult:
-        window = np.hanning(self.size)
-        segment = iq[: self.size] * window
-        fft = np.fft.fftshift(np.fft.fft(segment))
-        mag = np.abs(fft)
-        mag_db = linear_to_db(mag / np.max(mag))
-
-        if self._avg_buffer is None:
-            self._avg_buffer = mag_db
+        """Fold one frame into the running spectrum.
+
+        Complex IQ yields the full two-sided spectrum. Real-valued input has a
+        Hermitian-symmetric spectrum, so only the ``size // 2 + 1`` non-negative
+        bins are computed with ``rfft``.
+        """
+
+        return self.process_frames(iq[: self.size], max_frames=1)
+
+    def process_frames(self, iq: np.ndarray, max_frames: int = 8) -> SpectrumResult:
+        """Fold up to ``max_frames`` consecutive frames of ``iq`` into the running spectrum.
+
+        The frames are windowed with one broadcast multiply and transformed with a
+        single batched FFT, then folded into the averages in order; the result
+        reflects the state after the last frame. Input shorter than ``size`` is
+        windowed at its own length and zero-padded to one frame.
+        """
+
+        count = max(1, min(len(iq) // self.size, max_frames))
+        is_complex = np.iscomplexobj(iq)
+        frames = self._frame_scratch(count, np.complex64 if is_complex else np.float32)
+        if len(iq) < self.size:
+            # The in-place FFT clobbers the scratch, so the pad is re-zeroed every call.
+            np.multiply(iq, _hann(len(iq)), out=frames[0, : len(iq)])
+            frames[0, len(iq) :] = 0
+        else:
+            batch = iq[: count * self.size].reshape(count, self.size)
+            np.multiply(batch, _hann(self.size), out=frames)
+        if is_complex:
+            spectra = sp_fft.fft(frames, axis=1, overwrite_x=True, workers=-1)
+            to_power, freqs = _shifted_power, _shifted_freqs(self.size, self.sample_rate)
         else:
-            self._avg_buffer = (self._avg_buffer * self._count + mag_db) / (self._count + 1)
+            spectra = sp_fft.rfft(frames, axis=1, overwrite_x=True, workers=-1)
+            to_power, freqs = magnitude_squared, _rfft_freqs(self.size, self.sample_rate)
+        power = self._power_scratch(spectra.shape[1])
+        for spectrum in spectra:
+            self._accumulate(_relative_power_db(to_power(spectrum, out=power)))
+
+        # Publish a snapshot: the running buffers keep being updated in place.
+        plot_data = (self._peak_buffer if self.peak_hold else self._avg_buffer).copy()
+        peak_idx = int(np.argmax(plot_data))
+        result = SpectrumResult(freqs=freqs, magnitude_db=plot_data, peak_freq=float(freqs[peak_idx]), peak_db=float(plot_data[peak_idx]))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Spectrum updated", extra={"peak_freq": result.peak_freq, "peak_db": result.peak_db})
+        return result
+
+    def _frame_scratch(self, count: int, dtype: type) -> np.ndarray:
+        frames = self._frames
+        if frames is None or frames.dtype != dtype or len(frames) < count:
+            frames = self._frames = np.empty((count, self.size), dtype=dtype)
+        return frames[:count]
+
+    def _power_scratch(self, bins: int) -> np.ndarray:
+        if self._power is None or self._power.size != bins:
+            self._power = np.empty(bins, dtype=np.float32)
+        return self._power
+
+    def _accumulate(self, mag_db: np.ndarray) -> None:
+        """Fold ``mag_db`` into the running buffers in place; ``mag_db`` is scratch and is clobbered."""
+
+        if self._avg_buffer is not None and self._avg_buffer.shape != mag_db.shape:
+            # Input switched between real and complex: restart the averages.
+            self._avg_buffer = self._peak_buffer = None
+            self._count = 0
 
         if self.peak_hold:
             if self._peak_buffer is None:
-                self._peak_buffer = mag_db
+                self._peak_buffer = mag_db.copy()
             else:
-                self._peak_buffer = np.maximum(self._peak_buffer, mag_db)
-            plot_data = self._peak_buffer
+                np.maximum(self._peak_buffer, mag_db, out=self._peak_buffer)
+
+        if self._avg_buffer is None:
+            self._avg_buffer = mag_db.copy()
         else:
-            plot_data = self._avg_buffer
+            # avg = (avg * count + x) / (count + 1), without temporaries.
+            weight = 1.0 / (self._count + 1)
+            self._avg_buffer *= 1.0 - weight
+            mag_db *= weight
+            self._avg_buffer += mag_db
 
         self._count = min(self._count + 1, self.averaging)
-        freqs = np.fft.fftshift(np.fft.fftfreq(self.size, 1 / self.sample_rate))
-        peak_idx = int(np.argmax(plot_data))
-        result = SpectrumResult(freqs=freqs, magnitude_db=plot_data, peak_freq=float(freqs[peak_idx]), peak_db=float(plot_data[peak_idx]))
-        LOGGER.debug("Spectrum updated", extra={"peak_freq": result.peak_freq, "peak_db": result.peak_db})
-        return result
 
 
-__all__ = ["SpectrumAnalyzer", "SpectrumResult"]
+__all__ = ["SpectrumAnalyzer", "SpectrumResult", "magnitude_squared", "power_to_db"]
@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 import numpy as np
+from scipy import fft as sp_fft
 from scipy import signal
 
 from app.core.logger import get_logger
 from app.core.types import WaveformSpec
-from app.core.utils import ensure_safe_amplitude, linear_to_db
+from app.core.utils import ensure_safe_amplitude
+from app.dsp.spectrum import magnitude_squared
 
 LOGGER = get_logger(__name__)
 
+# Samples per multitone basis block; bounds the (tones x block) scratch buffers.
+_MULTITONE_BLOCK = 1 << 14
+# Kinds generate_waveform_chunks evaluates chunk by chunk instead of generating whole.
+_CHUNKED_KINDS = {"sine", "square", "triangle", "multitone", "chirp", "prbs"}
+
 SUPPORTED_WAVEFORMS = {"sine", "square", "triangle", "prbs", "multitone", "chirp", "ofdm", "arbitrary"}
 
 
@@ -26,26 +34,31 @@ def generate_waveform(
     amplitude: float,
     **kwargs,
 ) -> Tuple[np.ndarray, WaveformSpec]:
-    """Generate a waveform and return IQ samples with metadata."""
+    """Generate a waveform and return IQ samples with metadata.
+
+    The samples are always a C-contiguous ``complex64`` array, the layout the
+    drivers stream to the DAC without further conversion.
+    """
 
     amplitude, clipped = ensure_safe_amplitude(amplitude)
-    t = np.arange(int(sample_rate * duration_s)) / sample_rate
+    t = _time_axis(waveform_length(sample_rate, duration_s), float(sample_rate))
     if kind == "sine":
         freq = kwargs.get("frequency", 1e6)
-        iq = amplitude * np.exp(1j * 2 * np.pi * freq * t)
+        iq = _complex_tone(t, freq, amplitude)
     elif kind == "square":
         freq = kwargs.get("frequency", 1e6)
-        iq = amplitude * signal.square(2 * np.pi * freq * t)
+        iq = _square(t, freq, amplitude)
     elif kind == "triangle":
         freq = kwargs.get("frequency", 1e6)
-        iq = amplitude * signal.sawtooth(2 * np.pi * freq * t, 0.5)
+        iq = _triangle(t, freq, amplitude)
     elif kind == "prbs":
         order = int(kwargs.get("order", 9))
-        taps = signal.max_len_seq(order, length=len(t))[0]
-        iq = amplitude * (2 * taps - 1)
+        # Map one period of bits to +/-amplitude through a two-entry table, then repeat.
+        levels = np.array([-amplitude, amplitude], dtype=np.complex64)
+        iq = _repeat_to_length(levels[_prbs_period(order)], len(t))
     elif kind == "multitone":
         tones = kwargs.get("tones", [1e6, 1.5e6])
-        iq = sum(amplitude / len(tones) * np.exp(1j * 2 * np.pi * f * t) for f in tones)
+        iq = _multitone(t, tones, amplitude)
     elif kind == "chirp":
         f0 = kwargs.get("f_start", 1e6)
         f1 = kwargs.get("f_stop", 10e6)
@@ -53,17 +66,22 @@ def generate_waveform(
     elif kind == "ofdm":
         num_subcarriers = int(kwargs.get("num_subcarriers", 64))
         symbol = np.exp(1j * 2 * np.pi * np.random.rand(num_subcarriers))
-        iq = np.tile(np.fft.ifft(symbol), int(len(t) / num_subcarriers) + 1)[: len(t)]
-        iq *= amplitude
+        # Scale the single symbol, then repeat it straight into the complex64 output.
+        base = sp_fft.ifft(symbol, overwrite_x=True)
+        base *= amplitude
+        iq = _repeat_to_length(base.astype(np.complex64), len(t))
     elif kind == "arbitrary":
         path: Path = Path(kwargs["path"])
         iq = load_iq(path)
         if kwargs.get("normalize", True):
-            iq = amplitude * iq / np.max(np.abs(iq))
+            # One scaled write straight into the complex64 output buffer.
+            peak = peak_magnitude(iq)
+            scale = amplitude / peak if peak > 0.0 else 0.0
+            iq = np.multiply(iq, scale, dtype=np.complex64)
     else:
         raise ValueError(f"Unsupported waveform kind: {kind}")
 
-    iq = iq.astype(np.complex64)
+    iq = np.ascontiguousarray(iq, dtype=np.complex64)
     crest_factor = compute_crest_factor_db(iq)
     spec = WaveformSpec(
         name=name,
@@ -74,26 +92,262 @@ def generate_waveform(
         crest_factor_db=crest_factor,
         metadata={"clipped": clipped, **{k: float(v) for k, v in kwargs.items() if isinstance(v, (int, float))}},
     )
-    LOGGER.info("Generated waveform", extra={"name": name, "kind": kind, "crest_factor_db": crest_factor})
+    LOGGER.info(
+        "Generated waveform", extra={"waveform": name, "kind": kind, "crest_factor_db": crest_factor}
+    )
     return iq, spec
 
 
+def waveform_length(sample_rate: float, duration_s: float) -> int:
+    """Return the number of samples a waveform of ``duration_s`` seconds holds."""
+
+    return int(sample_rate * duration_s)
+
+
+def generate_waveform_chunks(
+    kind: str,
+    sample_rate: float,
+    duration_s: float,
+    amplitude: float,
+    chunk_samples: int = 1 << 16,
+    **kwargs,
+) -> Iterator[np.ndarray]:
+    """Yield the samples :func:`generate_waveform` would return as complex64 chunks.
+
+    Sine, square, triangle, multitone, chirp and PRBS waveforms are evaluated one
+    chunk at a time, so the working set stays at ``chunk_samples`` however long the
+    waveform is. Other kinds are generated whole and then sliced.
+    """
+
+    if kind not in _CHUNKED_KINDS:
+        # generate_waveform applies the amplitude limit itself.
+        iq, _ = generate_waveform(
+            name=f"{kind}-chunked",
+            kind=kind,
+            sample_rate=sample_rate,
+            duration_s=duration_s,
+            amplitude=amplitude,
+            **kwargs,
+        )
+        for start in range(0, len(iq), chunk_samples):
+            yield iq[start : start + chunk_samples]
+        return
+    amplitude, _ = ensure_safe_amplitude(amplitude)
+    num_samples = waveform_length(sample_rate, duration_s)
+    for start in range(0, num_samples, chunk_samples):
+        stop = min(start + chunk_samples, num_samples)
+        chunk = _waveform_chunk(kind, start, stop, sample_rate, duration_s, amplitude, kwargs)
+        yield np.ascontiguousarray(chunk, dtype=np.complex64)
+
+
+def _waveform_chunk(
+    kind: str,
+    start: int,
+    stop: int,
+    sample_rate: float,
+    duration_s: float,
+    amplitude: float,
+    kwargs: Dict[str, Any],
+) -> np.ndarray:
+    # Mirrors the branches of generate_waveform for samples [start, stop).
+    if kind == "prbs":
+        levels = np.array([-amplitude, amplitude], dtype=np.complex64)
+        period = _prbs_period(int(kwargs.get("order", 9)))
+        return levels[period[np.arange(start, stop) % len(period)]]
+    t = np.arange(start, stop) / float(sample_rate)
+    if kind == "sine":
+        return _complex_tone(t, kwargs.get("frequency", 1e6), amplitude)
+    if kind == "square":
+        return _square(t, kwargs.get("frequency", 1e6), amplitude)
+    if kind == "triangle":
+        return _triangle(t, kwargs.get("frequency", 1e6), amplitude)
+    if kind == "multitone":
+        return _multitone(t, kwargs.get("tones", [1e6, 1.5e6]), amplitude)
+    if kind == "chirp":
+        f0 = kwargs.get("f_start", 1e6)
+        f1 = kwargs.get("f_stop", 10e6)
+        return amplitude * signal.chirp(t, f0, duration_s, f1, method="linear")
+    raise ValueError(f"Waveform kind cannot be generated in chunks: {kind}")
+
+
+@lru_cache(maxsize=8)
+def _time_axis(num_samples: int, sample_rate: float) -> np.ndarray:
+    """Return the shared, read-only sample-time axis for ``num_samples`` at ``sample_rate``."""
+
+    t = np.arange(num_samples) / sample_rate
+    t.flags.writeable = False
+    return t
+
+
+def _complex_tone(t: np.ndarray, frequency: float, amplitude: float) -> np.ndarray:
+    """Return ``amplitude * exp(j*2*pi*frequency*t)`` as ``complex64``.
+
+    Cosine and sine are written straight into the real and imaginary halves of the
+    output, which avoids the complex ``exp`` and its complex128 temporaries. The
+    phase is wrapped to one cycle in float64 first, so the float32 trig that follows
+    stays accurate however long the waveform is.
+    """
+
+    phase = _cycle_fraction(t, frequency).astype(np.float32)
+    phase *= np.float32(2 * np.pi)
+    iq = np.empty(len(t), dtype=np.complex64)
+    np.cos(phase, out=iq.real)
+    np.sin(phase, out=iq.imag)
+    iq *= amplitude
+    return iq
+
+
+def _prbs_period(order: int) -> np.ndarray:
+    """Return one period (``2**order - 1`` bits) of the maximal-length sequence as ``uint8``."""
+
+    return np.unpackbits(_packed_prbs_period(order), count=(1 << order) - 1)
+
+
+@lru_cache(maxsize=16)
+def _packed_prbs_period(order: int) -> np.ndarray:
+    # Cached bit-packed (8 bits per byte) so long sequences stay small in memory.
+    packed = np.packbits(signal.max_len_seq(order)[0])
+    packed.flags.writeable = False
+    return packed
+
+
+def _cycle_fraction(t: np.ndarray, frequency: float) -> np.ndarray:
+    """Return the position within each period, in ``[0, 1)``, as a new float64 array."""
+
+    cycles = t * frequency
+    cycles -= np.floor(cycles)
+    return cycles
+
+
+def _real_to_iq(values: np.ndarray) -> np.ndarray:
+    iq = np.zeros(len(values), dtype=np.complex64)
+    iq.real = values
+    return iq
+
+
+def _square(t: np.ndarray, frequency: float, amplitude: float) -> np.ndarray:
+    """50 % duty square wave starting high, matching ``scipy.signal.square``."""
+
+    levels = _cycle_fraction(t, frequency)
+    levels *= 2.0
+    np.floor(levels, out=levels)  # 0 in the first half-period, 1 in the second
+    levels *= -2.0 * amplitude
+    levels += amplitude
+    return _real_to_iq(levels)
+
+
+def _triangle(t: np.ndarray, frequency: float, amplitude: float) -> np.ndarray:
+    """Symmetric triangle from -1 to +1 and back, matching ``scipy.signal.sawtooth(x, 0.5)``."""
+
+    levels = _cycle_fraction(t, frequency)
+    levels -= 0.5
+    np.abs(levels, out=levels)
+    levels *= -4.0 * amplitude
+    levels += amplitude
+    return _real_to_iq(levels)
+
+
+def _multitone(t: np.ndarray, tones: Iterable[float], amplitude: float) -> np.ndarray:
+    """Return equal-amplitude tones at ``tones`` Hz summing to ``amplitude`` peak.
+
+    Tones are evaluated into a ``(K, block)`` basis and summed with one BLAS
+    matrix-vector product per block, written straight into the output. The scratch
+    buffers are reused across blocks, so memory stays bounded for long waveforms.
+    """
+
+    freqs = np.asarray(list(tones), dtype=np.float64)
+    iq = np.zeros(len(t), dtype=np.complex64)
+    if freqs.size == 0 or iq.size == 0:
+        return iq
+    omega = freqs * (2 * np.pi)
+    weights = np.full(freqs.size, amplitude / freqs.size, dtype=np.complex64)
+    block = min(len(t), _MULTITONE_BLOCK)
+    phases = np.empty((freqs.size, block), dtype=np.float64)
+    basis = np.empty((freqs.size, block), dtype=np.complex64)
+    for start in range(0, len(t), block):
+        stop = min(start + block, len(t))
+        width = stop - start
+        np.multiply.outer(omega, t[start:stop], out=phases[:, :width])
+        np.cos(phases[:, :width], out=basis.real[:, :width])
+        np.sin(phases[:, :width], out=basis.imag[:, :width])
+        np.matmul(weights, basis[:, :width], out=iq[start:stop])
+    return iq
+
+
+def _repeat_to_length(block: np.ndarray, length: int) -> np.ndarray:
+    """Return ``block`` repeated cyclically to exactly ``length`` samples.
+
+    Fills one preallocated output instead of tiling past ``length`` and slicing.
+    """
+
+    out = np.empty(length, dtype=block.dtype)
+    period = len(block)
+    full, remainder = divmod(length, period)
+    out[: full * period].reshape(full, period)[:] = block
+    out[full * period :] = block[:remainder]
+    return out
+
+
 def compute_crest_factor_db(iq: np.ndarray) -> float:
-    peak = np.max(np.abs(iq))
-    rms = np.sqrt(np.mean(np.abs(iq) ** 2))
-    crest_factor = linear_to_db(peak / max(rms, 1e-9))
-    return float(crest_factor)
+    """Return the peak-to-RMS ratio of ``iq`` in dB (``0.0`` for empty or silent input).
+
+    Peak and mean power both come from one ``|z|^2`` buffer, and the ratio is taken
+    in the power domain so only scalars are converted to dB.
+    """
+
+    if iq.size == 0:
+        return 0.0
+    mag2 = magnitude_squared(iq)
+    peak2 = float(mag2.max())
+    if peak2 == 0.0:
+        return 0.0
+    mean2 = float(mag2.mean(dtype=np.float64))
+    # 10*log10 of the power ratio is 20*log10 of the amplitude ratio, minus the sqrt.
+    return 10.0 * math.log10(peak2 / mean2)
+
+
+def peak_magnitude(iq: np.ndarray, chunk: int = 1 << 20) -> float:
+    """Return ``max(|iq|)`` (``0.0`` when empty).
+
+    The peak is taken over ``|iq|**2`` in fixed-size chunks, which bounds the
+    working set for memory-mapped imports.
+    """
+
+    peak2 = 0.0
+    for start in range(0, iq.size, chunk):
+        peak2 = max(peak2, float(magnitude_squared(iq[start : start + chunk]).max()))
+    return math.sqrt(peak2)
 
 
 def load_iq(path: Path) -> np.ndarray:
+    """Memory-map an arbitrary ``.npy`` waveform read-only instead of reading it into RAM."""
+
     if path.suffix == ".npy":
-        return np.load(path)
+        return np.load(path, mmap_mode="r")
     raise ValueError(f"Unsupported arbitrary IQ format: {path.suffix}")
 
 
+@lru_cache(maxsize=8)
+def _window(name: str, size: int) -> np.ndarray:
+    """Return the shared, read-only float32 ``name`` window of ``size`` samples."""
+
+    window = signal.get_window(name, size).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
 def window_iq(iq: np.ndarray, window: str = "hann") -> np.ndarray:
-    win = signal.get_window(window, len(iq))
-    return iq * win
+    """Return ``iq`` tapered by ``window``; complex64 input stays complex64."""
+
+    return iq * _window(window, len(iq))
 
 
-__all__ = ["generate_waveform", "compute_crest_factor_db", "window_iq", "SUPPORTED_WAVEFORMS"]
+__all__ = [
+    "generate_waveform",
+    "generate_waveform_chunks",
+    "compute_crest_factor_db",
+    "peak_magnitude",
+    "waveform_length",
+    "window_iq",
+    "SUPPORTED_WAVEFORMS",
+]
@@ -12,6 +12,13 @@ from app.core.logger import get_logger
 
 LOGGER = get_logger(__name__)
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ProfileStore:
     """Persist and recall experiment YAMLs with schema versioning."""
@@ -27,14 +34,13 @@ class ProfileStore:
         payload["schema_version"] = self.schema_version
         path = self.directory / f"{name}.yaml"
         with path.open("w", encoding="utf-8") as handle:
-            yaml.safe_dump(payload, handle)
+            yaml.dump(payload, handle, Dumper=_YamlDumper)
         LOGGER.info("Saved profile", extra={"path": str(path)})
         return path
 
     def load(self, name: str) -> Dict[str, Any]:
         path = self.directory / f"{name}.yaml"
-        with path.open("r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle) or {}
+        payload = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
         version = payload.get("schema_version")
         if version != self.schema_version:
             LOGGER.warning(
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import threading
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 import numpy as np
 
-from app.core.events import GLOBAL_BUS
+from app.core.events import GLOBAL_BUS, RX_SPECTRUM
 from app.core.logger import get_logger
 from app.dsp.spectrum import SpectrumAnalyzer
 from app.drivers.pluto_base import PlutoBase
@@ -40,19 +40,39 @@ class RxPipeline:
             self._thread.join(timeout=1.0)
 
     def _loop(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                iq = self.driver.capture_rx(duration_s=0.02, sample_rate=self.sample_rate)
-            except NotImplementedError:
-                LOGGER.debug("RX capture not implemented for driver")
-                return
-            except Exception:  # pragma: no cover
-                LOGGER.exception("RX capture failed")
-                time.sleep(1.0)
-                continue
-            spectrum = self._analyzer.process(iq)
-            GLOBAL_BUS.publish("rx:spectrum", spectrum)
-            time.sleep(0.1)
+        # Spectra are computed on a single worker while the next capture is in
+        # flight; results are published one iteration later, in capture order.
+        pending: Optional[Future] = None
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rx-spectrum") as executor:
+            while not self._stop_event.is_set():
+                try:
+                    iq = self.driver.capture_rx(duration_s=0.02, sample_rate=self.sample_rate)
+                except NotImplementedError:
+                    LOGGER.debug("RX capture not implemented for driver")
+                    break
+                except Exception:  # pragma: no cover
+                    LOGGER.exception("RX capture failed")
+                    self._stop_event.wait(1.0)
+                    continue
+                if pending is not None:
+                    self._publish(pending)
+                pending = executor.submit(self._analyzer.process_frames, iq)
+                self._stop_event.wait(0.1)
+            if pending is not None:
+                if self._stop_event.is_set():
+                    # Monitoring was stopped: the UI must not repaint after stop().
+                    pending.cancel()
+                else:
+                    self._publish(pending)
+
+    @staticmethod
+    def _publish(pending: Future) -> None:
+        try:
+            spectrum = pending.result()
+        except Exception:  # pragma: no cover
+            LOGGER.exception("RX spectrum processing failed")
+            return
+        GLOBAL_BUS.publish(RX_SPECTRUM, spectrum)
 
 
 __all__ = ["RxPipeline"]
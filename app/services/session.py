@@ -7,7 +7,7 @@ import time
 from typing import Callable, Dict
 
 from app.core.config import AppConfig
-from app.core.events import GLOBAL_BUS
+from app.core.events import DEVICE_CONNECTED, DEVICE_DISCONNECTED, DISCOVERY_UPDATE, GLOBAL_BUS
 from app.core.logger import get_logger
 from app.core.types import DeviceConn
 from app.drivers.pluto_base import PlutoBase
@@ -47,7 +47,7 @@ class SessionManager:
     def _discovery_loop(self) -> None:
         while not self._stop_discovery.is_set():
             devices = self._probe_devices()
-            GLOBAL_BUS.publish("discovery:update", devices)
+            GLOBAL_BUS.publish(DISCOVERY_UPDATE, devices)
             time.sleep(self.config.discovery.discovery_interval_s)
 
     def _probe_devices(self) -> list[DeviceConn]:
@@ -64,14 +64,14 @@ class SessionManager:
         connection = self._driver.connect(uri)
         self.connection = connection
         self.capabilities = self._driver.query_capabilities()
-        GLOBAL_BUS.publish("device:connected", connection)
+        GLOBAL_BUS.publish(DEVICE_CONNECTED, connection)
         LOGGER.info("Connected", extra={"uri": uri, "capabilities": self.capabilities})
         return connection
 
     def disconnect(self) -> None:
         if self._driver:
             self._driver.disconnect()
-            GLOBAL_BUS.publish("device:disconnected")
+            GLOBAL_BUS.publish(DEVICE_DISCONNECTED)
             self._driver = None
         self.connection = None
 
@@ -2,118 +2,230 @@
 
 from __future__ import annotations
 
+import math
 import queue
 import threading
 import time
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, replace
+from typing import Dict, List, Literal, Tuple
 
 import numpy as np
 
-from app.core.events import GLOBAL_BUS
+from app.core.events import GLOBAL_BUS, WAVEFORM_WARNING, tx_event
 from app.core.logger import get_logger
+from app.core.rt import boost_current_thread
 from app.core.types import TxConfig, WaveformSpec
 from app.core.utils import ensure_safe_amplitude, nyquist_check
+from app.dsp.spectrum import magnitude_squared
 from app.dsp.wavegen import generate_waveform
 from app.drivers.pluto_base import PlutoBase
 
 LOGGER = get_logger(__name__)
 
+CoalesceMode = Literal["latest", "concat"]
+
+# A running event is re-published on every Nth transmission even without a state change.
+_HEARTBEAT_EVERY = 10
+
 
 @dataclass
 class TxStatus:
     running: bool = False
     underrun: bool = False
     timestamp: float = 0.0
+    # Transmissions since the worker started; a jump between events shows skipped ones.
+    sequence: int = 0
 
 
 class TxWorker(threading.Thread):
-    def __init__(self, driver: PlutoBase, channel: str, queue: "queue.Queue[np.ndarray]") -> None:
+    """Feeds queued buffers to the driver, one ``start_tx`` per wakeup.
+
+    Buffers queued between wakeups are coalesced: ``"latest"`` transmits only the
+    newest one (the cyclic-TX default, where older waveforms are already stale) and
+    ``"concat"`` joins them into one contiguous buffer for streaming use.
+    """
+
+    def __init__(
+        self,
+        driver: PlutoBase,
+        channel: str,
+        queue: "queue.Queue[np.ndarray]",
+        realtime: bool = False,
+        coalesce: CoalesceMode = "latest",
+    ) -> None:
+        if coalesce not in ("latest", "concat"):
+            raise ValueError(f"Unsupported coalesce mode: {coalesce}")
         super().__init__(daemon=True)
         self.driver = driver
         self.channel = channel
         self.queue = queue
+        self.realtime = realtime
+        self.coalesce = coalesce
         self._stop_event = threading.Event()
+        # Set by producers after enqueuing and by stop(); the timeout is only a keepalive.
+        self._wakeup = threading.Event()
+        self._running_event = tx_event(channel, "running")
+        self._stopped_event = tx_event(channel, "stopped")
         self.status = TxStatus()
+        # (running, underrun) as of the last running event, for edge detection.
+        self._published_state = (False, False)
 
     def run(self) -> None:
+        if self.realtime:
+            boost_current_thread()
         while not self._stop_event.is_set():
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+            pending = self._drain()
+            if not pending:
+                continue
+            if self._stop_event.is_set():
+                # Stopped after the drain: drop the buffers but still acknowledge them.
+                for _ in pending:
+                    self.queue.task_done()
+            else:
+                self._transmit(pending)
+
+    def _drain(self) -> List[np.ndarray]:
+        pending: List[np.ndarray] = []
+        while True:
             try:
-                data = self.queue.get(timeout=0.1)
+                pending.append(self.queue.get_nowait())
             except queue.Empty:
-                continue
+                return pending
+
+    def _transmit(self, pending: List[np.ndarray]) -> None:
+        if len(pending) == 1 or self.coalesce == "latest":
+            data = pending[-1]
+        else:
+            data = np.concatenate(pending)
+        status = self.status
+        try:
             try:
                 self.driver.start_tx(self.channel, data)
-                self.status.running = True
-                self.status.timestamp = time.time()
-                GLOBAL_BUS.publish(f"tx:{self.channel}:running", self.status)
-            except Exception:  # pragma: no cover
+            except Exception:
                 LOGGER.exception("TX worker failed")
-                self.status.underrun = True
-            finally:
+                status.underrun = True
+                heartbeat = False
+            else:
+                status.running = True
+                status.underrun = False
+                status.sequence += 1
+                heartbeat = status.sequence % _HEARTBEAT_EVERY == 0
+            status.timestamp = time.time()
+            # Edge-triggered: publish when (running, underrun) changes, otherwise only
+            # as a periodic heartbeat. Subscribers get a snapshot, not the live status.
+            state = (status.running, status.underrun)
+            if heartbeat or state != self._published_state:
+                self._published_state = state
+                GLOBAL_BUS.publish(self._running_event, replace(status))
+        finally:
+            for _ in pending:
                 self.queue.task_done()
 
+    def notify(self) -> None:
+        """Wake the worker after a buffer has been queued."""
+
+        self._wakeup.set()
+
     def stop(self) -> None:
         self._stop_event.set()
+        self._wakeup.set()
         self.status.running = False
-        GLOBAL_BUS.publish(f"tx:{self.channel}:stopped", self.status)
+        GLOBAL_BUS.publish(self._stopped_event, replace(self.status))
 
 
 class TxPipeline:
     """Owns waveform generation, configuration, and worker coordination."""
 
-    def __init__(self, driver: PlutoBase) -> None:
+    def __init__(self, driver: PlutoBase, realtime: bool = False) -> None:
+        """Start one worker per channel; ``realtime`` raises their OS scheduling priority."""
+
         self.driver = driver
         self._queues: Dict[str, queue.Queue[np.ndarray]] = {
             "tx1": queue.Queue(maxsize=2),
             "tx2": queue.Queue(maxsize=2),
         }
         self._workers: Dict[str, TxWorker] = {
-            channel: TxWorker(driver, channel, q) for channel, q in self._queues.items()
+            channel: TxWorker(driver, channel, q, realtime) for channel, q in self._queues.items()
         }
         self._last_waveform: Dict[str, tuple[np.ndarray, WaveformSpec]] = {}
+        # (sample_rate, bandwidth) last validated per channel, so repeated configures
+        # from slider drags neither re-check nor re-warn.
+        self._checked_rates: Dict[str, Tuple[float, float]] = {}
+        # Config last applied and queued per channel; cleared by push_waveform and stop.
+        self._applied: Dict[str, TxConfig] = {}
         for worker in self._workers.values():
             worker.start()
 
     def configure(self, config: TxConfig) -> WaveformSpec:
-        nyquist_check(config.sample_rate, config.bandwidth_hz)
-        self.driver.set_tx_config(config.channel, config)
-        iq_spec = self._last_waveform.get(config.channel)
+        """Apply ``config`` and queue the channel's waveform; a repeat config is a no-op."""
+
+        channel = config.channel
+        if self._applied.get(channel) == config:
+            return self._last_waveform[channel][1]
+        rates = (config.sample_rate, config.bandwidth_hz)
+        if self._checked_rates.get(channel) != rates:
+            nyquist_check(*rates)
+            self._checked_rates[channel] = rates
+        self.driver.set_tx_config(channel, config)
+        iq_spec = self._last_waveform.get(channel)
         if config.waveform and iq_spec:
             iq, spec = iq_spec
         elif iq_spec:
             iq, spec = iq_spec
         else:
             iq, spec = generate_waveform(
-                name=f"{config.channel}-default",
+                name=f"{channel}-default",
                 kind="sine",
                 sample_rate=config.sample_rate,
                 duration_s=0.01,
                 amplitude=0.8,
                 frequency=1e6,
             )
-            self._last_waveform[config.channel] = (iq, spec)
+            self._last_waveform[channel] = (iq, spec)
         try:
-            self._queues[config.channel].put_nowait(iq)
+            self._queues[channel].put_nowait(iq)
         except queue.Full:
-            LOGGER.warning("TX queue backpressure", extra={"channel": config.channel})
+            LOGGER.warning("TX queue backpressure", extra={"channel": channel})
+        else:
+            self._applied[channel] = config
+            self._workers[channel].notify()
         return spec
 
-    def push_waveform(self, channel: str, iq: np.ndarray, spec: WaveformSpec) -> None:
-        max_amp = np.max(np.abs(iq))
-        safe_amp, clipped = ensure_safe_amplitude(float(max_amp))
+    def push_waveform(self, channel: str, iq: np.ndarray, spec: WaveformSpec) -> WaveformSpec:
+        """Queue ``iq`` for ``channel`` and return the spec updated for any clipping."""
+
+        # Peak from one |iq|^2 pass, reduced before the scalar sqrt.
+        max_amp = math.sqrt(float(magnitude_squared(iq).max())) if iq.size else 0.0
+        safe_amp, clipped = ensure_safe_amplitude(max_amp)
         if clipped and max_amp > 0:
-            iq = iq * (safe_amp / max_amp)
-            GLOBAL_BUS.publish("waveform:warning", f"Amplitude clipped for {channel}")
+            # The caller's buffer may be shared or a read-only memmap, so the scaled
+            # copy is the one allocation; it is written as complex64 directly.
+            iq = np.multiply(iq, safe_amp / max_amp, dtype=np.complex64)
+            GLOBAL_BUS.publish(WAVEFORM_WARNING, f"Amplitude clipped for {channel}")
+        else:
+            # No copy when the samples are already contiguous complex64.
+            iq = np.ascontiguousarray(iq, dtype=np.complex64)
+        pad = -len(iq) % self.driver.tx_block_size(channel)
+        if pad:
+            # Zero-pad once here so the remembered waveform is already block-aligned.
+            padded = np.zeros(len(iq) + pad, dtype=np.complex64)
+            padded[: len(iq)] = iq
+            iq = padded
+        spec = replace(spec, amplitude=float(safe_amp), num_samples=len(iq))
+        self._last_waveform[channel] = (iq, spec)
+        self._applied.pop(channel, None)
         try:
-            spec.amplitude = float(safe_amp)
-            spec.num_samples = len(iq)
-            self._last_waveform[channel] = (iq.astype(np.complex64), spec)
-            self._queues[channel].put_nowait(self._last_waveform[channel][0])
+            self._queues[channel].put_nowait(iq)
         except queue.Full:
             LOGGER.error("TX queue full", extra={"channel": channel})
+        else:
+            self._workers[channel].notify()
+        return spec
 
     def stop(self, channel: str) -> None:
+        self._applied.pop(channel, None)
         self.driver.stop_tx(channel)
         self._workers[channel].stop()
 
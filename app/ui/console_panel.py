@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import logging
-from queue import Queue
-from typing import Optional
+from typing import Deque, Optional
 
 from PyQt6 import QtWidgets
 
+# Upper bound on records drained per timer tick so a log burst cannot stall the UI.
+_MAX_RECORDS_PER_TICK = 500
+# Filter choices mapped to level numbers once, instead of a getattr per drain.
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 class ConsolePanel(QtWidgets.QGroupBox):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__("Console", parent)
         self.text = QtWidgets.QPlainTextEdit(readOnly=True)
         self.filter_combo = QtWidgets.QComboBox()
-        self.filter_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.filter_combo.addItems(list(_LEVELS))
         self.save_button = QtWidgets.QPushButton("Save Logs")
 
         layout = QtWidgets.QVBoxLayout(self)
@@ -25,22 +36,28 @@ class ConsolePanel(QtWidgets.QGroupBox):
         layout.addLayout(controls)
         layout.addWidget(self.text)
 
-        self.queue: Queue | None = None
+        self.queue: Deque[logging.LogRecord] | None = None
         self.save_button.clicked.connect(self._save_logs)
 
-    def attach_queue(self, queue: Queue) -> None:
+    def attach_queue(self, queue: Deque[logging.LogRecord]) -> None:
         self.queue = queue
 
     def drain_queue(self) -> None:
         if not self.queue:
             return
-        level_filter = self.filter_combo.currentText()
-        threshold = getattr(logging, level_filter)
-        while not self.queue.empty():
-            record = self.queue.get_nowait()
-            if record.levelno < threshold:
-                continue
-            self.text.appendPlainText(record.getMessage())
+        threshold = _LEVELS[self.filter_combo.currentText()]
+        popleft = self.queue.popleft
+        lines: list[str] = []
+        for _ in range(_MAX_RECORDS_PER_TICK):
+            try:
+                record = popleft()
+            except IndexError:
+                break
+            if record.levelno >= threshold:
+                lines.append(record.getMessage())
+        if lines:
+            # One append per tick instead of one document update per record.
+            self.text.appendPlainText("\n".join(lines))
 
     def _save_logs(self) -> None:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Logs", "logs/session.log")
@@ -2,31 +2,51 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 
 class DeviceSvgWidget(QtWidgets.QFrame):
+    """Front-panel sketch whose two states are rasterised once per size and then blitted."""
+
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.setFixedHeight(160)
         self._active = False
+        self._pixmaps: Dict[bool, QtGui.QPixmap] = {}
         self.setFrameStyle(QtWidgets.QFrame.Shape.StyledPanel | QtWidgets.QFrame.Shadow.Raised)
 
     def set_status(self, active: bool) -> None:
+        if active == self._active:
+            return
         self._active = active
         self.update()
 
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # noqa: N802
+        self._pixmaps.clear()
+        super().resizeEvent(event)
+
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
-        painter = QtGui.QPainter(self)
+        pixmap = self._pixmaps.get(self._active)
+        if pixmap is None:
+            pixmap = self._pixmaps[self._active] = self._render(self._active)
+        QtGui.QPainter(self).drawPixmap(0, 0, pixmap)
+
+    def _render(self, active: bool) -> QtGui.QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+        painter = QtGui.QPainter(pixmap)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         rect = self.rect().adjusted(10, 10, -10, -10)
         painter.setPen(QtCore.Qt.GlobalColor.darkGray)
         painter.setBrush(QtGui.QColor("#2d2d30"))
         painter.drawRoundedRect(rect, 10, 10)
 
-        pen = QtGui.QPen(QtGui.QColor("#4caf50" if self._active else "#777"), 4)
+        pen = QtGui.QPen(QtGui.QColor("#4caf50" if active else "#777"), 4)
         painter.setPen(pen)
         painter.drawLine(rect.left() + 60, rect.center().y(), rect.left() + 160, rect.center().y())
         painter.drawLine(rect.right() - 160, rect.center().y(), rect.right() - 60, rect.center().y())
@@ -34,6 +54,8 @@ class DeviceSvgWidget(QtWidgets.QFrame):
         painter.setPen(QtCore.Qt.GlobalColor.white)
         painter.drawText(rect.left() + 20, rect.center().y() - 20, "TX1")
         painter.drawText(rect.right() - 100, rect.center().y() - 20, "TX2")
+        painter.end()
+        return pixmap
 
 
 __all__ = ["DeviceSvgWidget"]
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import argparse
 import sys
+from dataclasses import replace
 from pathlib import Path
-from queue import Queue
 
 from PyQt6 import QtWidgets
 
 from app.core.config import load_config
-from app.core.logger import configure_logging, set_gui_queue
+from app.core.logger import configure_logging, make_gui_queue, set_gui_queue
 from app.core.utils import install_excepthook
 from app.services.session import SessionManager
 from .main_window import MainWindow
@@ -28,10 +28,9 @@ def main() -> int:
     args = parse_args()
     config = load_config(args.config)
     if args.debug:
-        config.debug = True
-        config.logging.level = "DEBUG"
+        config = replace(config, debug=True, logging=replace(config.logging, level="DEBUG"))
 
-    gui_queue: Queue = Queue()
+    gui_queue = make_gui_queue()
     set_gui_queue(gui_queue)
     configure_logging(
         level=config.logging.level,
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from queue import Queue
-from typing import Optional
+import logging
+from pathlib import Path
+from typing import Deque, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from app.core.config import AppConfig
-from app.core.events import GLOBAL_BUS
+from app.core.events import GLOBAL_BUS, RX_SPECTRUM, WAVEFORM_WARNING
 from app.core.logger import get_logger
 from app.core.types import DeviceConn, TxConfig
 from app.services.session import SessionManager
@@ -24,15 +25,19 @@ from .device_svg import DeviceSvgWidget
 
 LOGGER = get_logger(__name__)
 
+_STYLESHEET_PATH = Path("resources/style.qss")
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """Primary control window for the Pluto+ dual TX station."""
 
+    _stylesheet_loaded = QtCore.pyqtSignal(str)
+
     def __init__(
         self,
         config: AppConfig,
         session: SessionManager,
-        gui_queue: Queue,
+        gui_queue: Deque[logging.LogRecord],
         use_mock: bool = False,
         parent: Optional[QtWidgets.QWidget] = None,
     ) -> None:
@@ -85,11 +90,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self._load_stylesheet()
 
     def _load_stylesheet(self) -> None:
-        path = QtCore.QFile("resources/style.qss")
-        if path.exists():
-            if path.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
-                stylesheet = bytes(path.readAll()).decode("utf-8")
-                self.setStyleSheet(stylesheet)
+        """Read the stylesheet on a pool thread and apply it once it arrives.
+
+        The first paint does not wait on disk I/O; the queued signal hands the text
+        back to the UI thread, where ``setStyleSheet`` must run.
+        """
+
+        self._stylesheet_loaded.connect(
+            self.setStyleSheet, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(self._read_stylesheet)
+
+    def _read_stylesheet(self) -> None:
+        try:
+            stylesheet = _STYLESHEET_PATH.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            return
+        self._stylesheet_loaded.emit(stylesheet)
 
     def _connect_signals(self) -> None:
         self.device_panel.device_connected.connect(self._on_device_connected)
@@ -97,8 +114,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tx_panel.tx_config_requested.connect(self._on_tx_config)
         self.tx_panel.tx_stop_requested.connect(self._on_tx_stop)
         self.waveform_panel.waveform_generated.connect(self._on_waveform_generated)
-        GLOBAL_BUS.subscribe("rx:spectrum", self.spectrum_panel.update_spectrum)
-        GLOBAL_BUS.subscribe("waveform:warning", self.waveform_panel.show_warning)
+        GLOBAL_BUS.subscribe(RX_SPECTRUM, self.spectrum_panel.submit_spectrum)
+        GLOBAL_BUS.subscribe(WAVEFORM_WARNING, self.waveform_panel.show_warning)
 
     def _start_timers(self) -> None:
         self._log_timer = QtCore.QTimer(self)
@@ -110,7 +127,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._status_timer.start(2000)
 
     def _on_device_connected(self, connection: DeviceConn) -> None:
-        self.tx_pipeline = TxPipeline(self.session.driver)
+        self.tx_pipeline = TxPipeline(self.session.driver, realtime=self.config.realtime_tx)
         self.rx_pipeline = RxPipeline(self.session.driver, self.config.tx1.sample_rate_sps)
         self.rx_pipeline.start()
         self.tx_panel.set_enabled(True)
@@ -140,7 +157,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _on_waveform_generated(self, channel: str, iq, spec) -> None:
         if self.tx_pipeline:
-            self.tx_pipeline.push_waveform(channel, iq, spec)
+            spec = self.tx_pipeline.push_waveform(channel, iq, spec)
             self.tx_panel.update_waveform_metadata(channel, spec)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802
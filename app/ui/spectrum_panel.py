@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
 
 import numpy as np
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 import pyqtgraph as pg
 
 from app.core.config import AppConfig
@@ -14,12 +16,43 @@ from app.dsp.spectrum import SpectrumResult
 
 LOGGER = get_logger(__name__)
 
+# Minimum spacing between repaints (~60 Hz); results arriving faster are coalesced.
+_FRAME_INTERVAL_MS = 16
+_WATERFALL_ROWS = 100
+# Fixed waterfall colour range; spectra are in dB relative to their own peak.
+_WATERFALL_LEVELS = (-100.0, 0.0)
+# Opaque greyscale 0xFFRRGGBB pixel for each of the 256 quantised levels.
+_WATERFALL_LUT = np.arange(256, dtype=np.uint32) * np.uint32(0x010101) | np.uint32(0xFF000000)
+# Export dialog filters and the suffix each one writes; the first is the default.
+_EXPORT_FILTERS = {"NumPy (*.npy)": ".npy", "CSV (*.csv)": ".csv"}
+
+
+def _waterfall_pixels(row: np.ndarray) -> np.ndarray:
+    """Map a dB row onto RGB32 pixels through the fixed levels and the colour LUT."""
+
+    low, high = _WATERFALL_LEVELS
+    scaled = np.subtract(row, low, dtype=np.float32)
+    scaled *= 255.0 / (high - low)
+    np.clip(scaled, 0.0, 255.0, out=scaled)
+    return _WATERFALL_LUT[scaled.astype(np.uint8)]
+
 
 class SpectrumPanel(QtWidgets.QGroupBox):
+    _flush_requested = QtCore.pyqtSignal()
+
     def __init__(self, config: AppConfig, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__("Spectrum", parent)
         self.plot = pg.PlotWidget(title="FFT")
-        self.waterfall = pg.ImageView()
+        self.plot.setDownsampling(auto=True, mode="peak")
+        self.plot.setClipToView(True)
+        self._curve = self.plot.plot()
+        # The waterfall is a plain RGB32 image scaled into a label: no per-frame
+        # histogram, level or LUT work as with an ImageView.
+        self.waterfall = QtWidgets.QLabel()
+        self.waterfall.setScaledContents(True)
+        self.waterfall.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Ignored, QtWidgets.QSizePolicy.Policy.Ignored
+        )
         self.marker_label = QtWidgets.QLabel("Peak: -- Hz / -- dB")
         self.export_button = QtWidgets.QPushButton("Export")
 
@@ -29,27 +62,94 @@ class SpectrumPanel(QtWidgets.QGroupBox):
         layout.addWidget(self.marker_label)
         layout.addWidget(self.export_button)
 
-        self._history: list[np.ndarray] = []
+        # Ring of RGB32 waterfall rows, each written twice (at i and i + rows) so the
+        # history is always one contiguous oldest-first slice without reordering.
+        self._waterfall_rows: Optional[np.ndarray] = None
+        self._head = 0
+        self._filled = 0
+        self._latest: Optional[np.ndarray] = None
+        self._pending: Optional[Tuple[SpectrumResult, np.ndarray]] = None
+        self._pending_lock = threading.Lock()
+        self._flush_requested.connect(
+            self._schedule_flush, QtCore.Qt.ConnectionType.QueuedConnection
+        )
         self.export_button.clicked.connect(self._export)
 
-    def update_spectrum(self, result: SpectrumResult) -> None:
-        self.plot.clear()
-        self.plot.plot(result.freqs, result.magnitude_db)
+    def submit_spectrum(self, result: SpectrumResult) -> None:
+        """Queue ``result`` for display; safe to call from any thread.
+
+        Only the newest result is kept and at most one repaint is scheduled per
+        frame interval, so a fast producer cannot flood the UI thread. The waterfall
+        row is quantised here, on the caller's (RX) thread, so the UI thread only
+        copies finished pixels.
+        """
+
+        pending = (result, _waterfall_pixels(result.magnitude_db))
+        with self._pending_lock:
+            scheduled = self._pending is not None
+            self._pending = pending
+        if not scheduled:
+            self._flush_requested.emit()
+
+    def _schedule_flush(self) -> None:
+        QtCore.QTimer.singleShot(_FRAME_INTERVAL_MS, self._flush)
+
+    def _flush(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self.update_spectrum(*pending)
+
+    def update_spectrum(self, result: SpectrumResult, pixels: Optional[np.ndarray] = None) -> None:
+        """Repaint with ``result``; ``pixels`` is its precomputed waterfall row, if any."""
+
+        if pixels is None:
+            pixels = _waterfall_pixels(result.magnitude_db)
+        self._curve.setData(result.freqs, result.magnitude_db)
         self.marker_label.setText(f"Peak: {result.peak_freq/1e6:.3f} MHz / {result.peak_db:.1f} dB")
-        self._history.append(result.magnitude_db)
-        if len(self._history) > 100:
-            self._history.pop(0)
-        image = np.array(self._history)
-        self.waterfall.setImage(image, autoLevels=True)
+        self._latest = result.magnitude_db
+        history = self._push_waterfall_row(pixels)
+        height, width = history.shape
+        image = QtGui.QImage(
+            history.data, width, height, 4 * width, QtGui.QImage.Format.Format_RGB32
+        )
+        # fromImage copies the pixels, so the ring can be overwritten afterwards.
+        self.waterfall.setPixmap(QtGui.QPixmap.fromImage(image))
+
+    def _push_waterfall_row(self, row: np.ndarray) -> np.ndarray:
+        """Store ``row`` as the newest waterfall line and return the history view."""
+
+        rows = self._waterfall_rows
+        if rows is None or rows.shape[1] != row.size:
+            rows = self._waterfall_rows = np.empty((2 * _WATERFALL_ROWS, row.size), np.uint32)
+            self._head = self._filled = 0
+        head = self._head
+        rows[head] = row
+        rows[head + _WATERFALL_ROWS] = row
+        self._head = (head + 1) % _WATERFALL_ROWS
+        self._filled = min(self._filled + 1, _WATERFALL_ROWS)
+        stop = head + _WATERFALL_ROWS + 1
+        return rows[stop - self._filled : stop]
 
     def _export(self) -> None:
-        if not self._history:
+        if self._latest is None:
             QtWidgets.QMessageBox.information(self, "Export", "No spectrum data available")
             return
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Spectrum", "spectrum.csv")
+        path, selected = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Spectrum", "spectrum.npy", ";;".join(_EXPORT_FILTERS)
+        )
         if path:
-            data = np.column_stack((np.arange(len(self._history[-1])), self._history[-1]))
-            np.savetxt(path, data, delimiter=",")
+            suffix = Path(path).suffix.lower()
+            if suffix not in _EXPORT_FILTERS.values():
+                # Not every platform dialog appends the chosen filter's extension.
+                suffix = _EXPORT_FILTERS.get(selected, ".npy")
+                path += suffix
+            data = np.column_stack((np.arange(len(self._latest)), self._latest))
+            if suffix == ".npy":
+                # Binary is the default: one buffer write instead of per-row text formatting.
+                np.save(path, data)
+            else:
+                np.savetxt(path, data, delimiter=",", fmt="%.6g")
 
 
 __all__ = ["SpectrumPanel"]
@@ -8,11 +8,21 @@ from typing import Optional, Tuple
 import numpy as np
 from PyQt6 import QtCore, QtWidgets
 import pyqtgraph as pg
+from scipy import fft as sp_fft
 
 from app.core.config import AppConfig
 from app.core.types import WaveformSpec
-from app.dsp.wavegen import SUPPORTED_WAVEFORMS, generate_waveform, compute_crest_factor_db
+from app.dsp.wavegen import (
+    SUPPORTED_WAVEFORMS,
+    compute_crest_factor_db,
+    generate_waveform,
+    peak_magnitude,
+)
 from app.dsp.iqio import load_iq
+from app.dsp.spectrum import magnitude_squared, power_to_db
+
+# Samples handed to the preview plots; more than this cannot be resolved on screen.
+_PLOT_MAX_SAMPLES = 1 << 16
 
 
 class WaveformPanel(QtWidgets.QGroupBox):
@@ -44,6 +54,14 @@ class WaveformPanel(QtWidgets.QGroupBox):
 
         self.time_plot = pg.PlotWidget(title="Time Domain")
         self.freq_plot = pg.PlotWidget(title="Frequency Domain")
+        for plot in (self.time_plot, self.freq_plot):
+            # Long waveforms are peak-decimated to the visible pixels instead of drawn in full.
+            plot.setDownsampling(auto=True, mode="peak")
+            plot.setClipToView(True)
+        # Curves are created once and refreshed with setData on every update.
+        self._curve_i = self.time_plot.plot(pen="c", name="I")
+        self._curve_q = self.time_plot.plot(pen="m", name="Q")
+        self._curve_spectrum = self.freq_plot.plot()
 
         form = QtWidgets.QFormLayout()
         form.addRow("Channel", self.channel_combo)
@@ -97,7 +115,7 @@ class WaveformPanel(QtWidgets.QGroupBox):
         spec = WaveformSpec(
             name=Path(path).stem,
             kind="arbitrary",
-            amplitude=float(np.max(np.abs(iq))),
+            amplitude=peak_magnitude(iq),
             sample_rate=float(sample_rate or self.config.tx1.sample_rate_sps),
             num_samples=len(iq),
             crest_factor_db=crest,
@@ -108,14 +126,22 @@ class WaveformPanel(QtWidgets.QGroupBox):
         self.waveform_generated.emit(channel, iq, spec)
 
     def _update_plots(self, iq: np.ndarray, sample_rate: float) -> None:
-        times = np.arange(len(iq)) / sample_rate
-        self.time_plot.clear()
-        self.time_plot.plot(times, iq.real, pen="c", name="I")
-        self.time_plot.plot(times, iq.imag, pen="m", name="Q")
-        spectrum = np.fft.fftshift(np.fft.fft(iq))
-        freqs = np.fft.fftshift(np.fft.fftfreq(len(iq), d=1 / sample_rate))
-        self.freq_plot.clear()
-        self.freq_plot.plot(freqs, 20 * np.log10(np.abs(spectrum) + 1e-12))
+        # Long waveforms are strided down for the time plot; the timestamps keep the
+        # original spacing so the axis still reads in seconds of the full waveform.
+        step = max(1, len(iq) // _PLOT_MAX_SAMPLES)
+        decimated = iq[::step]
+        times = np.arange(len(decimated)) * (step / sample_rate)
+        self._curve_i.setData(times, decimated.real)
+        self._curve_q.setData(times, decimated.imag)
+        # The spectrum uses a contiguous leading block instead of the strided samples,
+        # which would alias everything above ``sample_rate / step`` into the display.
+        # scipy's pocketfft keeps complex64 input in single precision; ``iq`` is emitted
+        # to the TX pipeline afterwards, so it must not be overwritten.
+        block = iq[:_PLOT_MAX_SAMPLES]
+        spectrum = sp_fft.fftshift(sp_fft.fft(block, workers=-1))
+        freqs = sp_fft.fftshift(sp_fft.fftfreq(len(block), d=1 / sample_rate))
+        magnitude_db = power_to_db(magnitude_squared(spectrum))
+        self._curve_spectrum.setData(freqs, magnitude_db)
 
     def show_warning(self, message: str) -> None:
         self.warning_banner.setText(message)
@@ -11,8 +11,8 @@ import numpy as np
 from app.core.config import load_config
 from app.core.logger import configure_logging
 from app.core.types import TxConfig
-from app.dsp.iqio import save_iq
-from app.dsp.wavegen import generate_waveform
+from app.dsp.iqio import save_iq_chunks
+from app.dsp.wavegen import generate_waveform_chunks, waveform_length
 from app.services.session import SessionManager
 from app.services.profiles import ProfileStore
 from app.drivers.pluto_mock import PlutoMockDriver
@@ -68,15 +68,16 @@ def cmd_export(args: argparse.Namespace) -> None:
         rotate_megabytes=config.logging.rotate_megabytes,
         rotate_backups=config.logging.rotate_backups,
     )
-    iq, _spec = generate_waveform(
-        name=args.kind,
+    sample_rate = config.tx1.sample_rate_sps
+    # Generated and written chunk by chunk so long exports never sit in memory whole.
+    chunks = generate_waveform_chunks(
         kind=args.kind,
-        sample_rate=config.tx1.sample_rate_sps,
+        sample_rate=sample_rate,
         duration_s=args.duration,
         amplitude=args.amplitude,
         frequency=args.frequency,
     )
-    save_iq(args.output, iq, config.tx1.sample_rate_sps)
+    save_iq_chunks(args.output, chunks, waveform_length(sample_rate, args.duration), sample_rate)
     print(f"Saved IQ to {args.output}")
 
 
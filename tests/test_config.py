@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from app.core.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def _isolate(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PLUTO_PROFILE_DIR", raising=False)
+
+
+def _write_config(path, level):
+    path.write_text(f"logging:\n  level: {level}\n", encoding="utf-8")
+
+
+def test_load_config_reuses_cached_instance(tmp_path):
+    path = tmp_path / "config.yaml"
+    _write_config(path, "INFO")
+    assert load_config(path) is load_config(path)
+
+
+def test_load_config_reloads_after_file_change(tmp_path):
+    path = tmp_path / "config.yaml"
+    _write_config(path, "INFO")
+    first = load_config(path)
+    _write_config(path, "DEBUG")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_config(path)
+    assert first.logging.level == "INFO"
+    assert second.logging.level == "DEBUG"
+
+
+def test_load_config_applies_overrides(tmp_path):
+    path = tmp_path / "config.yaml"
+    _write_config(path, "INFO")
+    config = load_config(path, overrides={"tx1": {"gain_db": -20.0}})
+    assert config.tx1.gain_db == -20.0
+    assert config.logging.level == "INFO"
+    assert load_config(path).tx1.gain_db == -10.0
+
+
+def test_load_config_rejects_out_of_range_values(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("tx1:\n  gain_db: 5.0\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="tx1.gain_db"):
+        load_config(path)
+
+
+def test_load_config_rejects_bandwidth_above_sample_rate(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("tx2:\n  sample_rate_sps: 1.0e6\n  rf_bandwidth_hz: 2.0e6\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Nyquist"):
+        load_config(path)
+
+
+def test_load_config_coerces_paths(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  log_dir: custom_logs\n", encoding="utf-8")
+    config = load_config(path)
+    assert config.logging.log_dir.name == "custom_logs"
+    assert config.logging.log_dir.is_dir()
+
+
+def test_load_config_falls_back_to_defaults_when_missing(tmp_path):
+    config = load_config(tmp_path / "missing.yaml")
+    assert config.tx1.sample_rate_sps == 30.72e6
@@ -0,0 +1,34 @@
+from app.core.events import EventBus
+
+
+def test_publish_invokes_subscribers_in_order():
+    bus = EventBus()
+    calls = []
+    bus.subscribe("demo", lambda value: calls.append(("first", value)))
+    bus.subscribe("demo", lambda value: calls.append(("second", value)))
+    bus.publish("demo", 3)
+    assert calls == [("first", 3), ("second", 3)]
+
+
+def test_unsubscribe_during_publish_keeps_current_snapshot():
+    bus = EventBus()
+    calls = []
+
+    def first() -> None:
+        calls.append("first")
+        bus.unsubscribe("demo", second)
+
+    def second() -> None:
+        calls.append("second")
+
+    bus.subscribe("demo", first)
+    bus.subscribe("demo", second)
+    bus.publish("demo")
+    bus.publish("demo")
+    assert calls == ["first", "second", "first"]
+
+
+def test_unsubscribe_unknown_callback_is_ignored():
+    bus = EventBus()
+    bus.unsubscribe("missing", lambda: None)
+    bus.publish("missing")
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from app.dsp.iqio import load_iq, save_iq, save_iq_chunks
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".c8", ".csv", ".wav"])
+def test_save_load_round_trip(tmp_path, suffix):
+    iq = (0.5 * np.exp(1j * np.linspace(0, 2 * np.pi, 64))).astype(np.complex64)
+    path = tmp_path / f"capture{suffix}"
+    save_iq(path, iq, sample_rate=1e6)
+    loaded, rate = load_iq(path)
+    assert loaded.dtype == np.complex64
+    assert loaded.flags.c_contiguous
+    assert type(loaded) is np.ndarray
+    assert np.allclose(loaded, iq, atol=1e-4)
+    assert rate == (1e6 if suffix == ".wav" else None)
+
+
+def test_wav_round_trip_at_full_scale(tmp_path):
+    iq = np.array([1 - 1j, -1 + 1j, 0.5 - 0.25j, 0j], dtype=np.complex64)
+    path = tmp_path / "full_scale.wav"
+    save_iq(path, iq, sample_rate=1e6)
+    loaded, _ = load_iq(path)
+    assert np.allclose(loaded, iq, rtol=0, atol=1 / 32768)
+    assert loaded[1].real == -1.0 and loaded[2] == iq[2]
+
+
+def test_load_empty_c8(tmp_path):
+    path = tmp_path / "empty.c8"
+    path.write_bytes(b"")
+    loaded, _ = load_iq(path)
+    assert loaded.size == 0
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".c8", ".csv", ".wav"])
+def test_save_iq_chunks_matches_single_save(tmp_path, suffix):
+    iq = (0.5 * np.exp(1j * np.linspace(0, 2 * np.pi, 100))).astype(np.complex64)
+    path = tmp_path / f"chunked{suffix}"
+    save_iq_chunks(path, (iq[i : i + 30] for i in range(0, 100, 30)), 100, sample_rate=1e6)
+    loaded, _ = load_iq(path)
+    assert np.allclose(loaded, iq, atol=1e-4)
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".c8", ".csv"])
+@pytest.mark.parametrize("count", [4, 12])
+def test_save_iq_chunks_removes_file_on_count_mismatch(tmp_path, suffix, count):
+    path = tmp_path / f"mismatch{suffix}"
+    with pytest.raises(ValueError):
+        save_iq_chunks(path, [np.zeros(count, dtype=np.complex64)], 8)
+    assert not path.exists()
@@ -0,0 +1,51 @@
+import logging
+
+import pytest
+
+from app.core import logger as logger_module
+from app.core.logger import (
+    GUI_LOG_CAPACITY,
+    configure_logging,
+    get_logger,
+    make_gui_queue,
+    set_gui_queue,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_configure_logging_writes_through_listener(tmp_path, restore_root_logger):
+    configure_logging("INFO", tmp_path, rotate_megabytes=1, rotate_backups=1)
+    get_logger("tests.logger").info("hello %s", "listener")
+    shutdown_logging()
+    shutdown_logging()  # a second call is a no-op
+    contents = (tmp_path / "pluto_plus.log").read_text(encoding="utf-8")
+    assert "INFO | tests.logger | hello listener" in contents
+
+
+def test_gui_queue_mirrors_records_into_bounded_deque(tmp_path, restore_root_logger, monkeypatch):
+    records = make_gui_queue()
+    assert records.maxlen == GUI_LOG_CAPACITY
+    monkeypatch.setattr(logger_module, "_GUI_QUEUE", None)
+    set_gui_queue(records)
+    configure_logging("INFO", tmp_path, rotate_megabytes=1, rotate_backups=1)
+    get_logger("tests.logger").warning("to the console")
+    shutdown_logging()
+    assert [record.getMessage() for record in records] == ["to the console"]
+
+
+def test_file_formatter_matches_stdlib_asctime():
+    stdlib = logging.Formatter("%(asctime)s | %(message)s")
+    cached = logger_module._SecondCachedFormatter("%(asctime)s | %(message)s")
+    for created in (1_700_000_000.001, 1_700_000_000.999, 1_700_000_001.5):
+        record = logging.LogRecord("t", logging.INFO, "", 0, "msg", None, None)
+        record.created, record.msecs = created, (created - int(created)) * 1000
+        assert cached.format(record) == stdlib.format(record)
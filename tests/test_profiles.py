@@ -0,0 +1,14 @@
+from dataclasses import replace
+
+from app.core.config import AppConfig, ProfileConfig
+from app.services.profiles import ProfileStore
+
+
+def test_profile_round_trip(tmp_path):
+    config = replace(AppConfig(), profile=ProfileConfig(directory=tmp_path))
+    store = ProfileStore(config)
+    store.save("bench", {"tx1": {"frequency_hz": 2.4e9, "enabled": True}})
+    payload = store.load("bench")
+    assert payload["tx1"] == {"frequency_hz": 2.4e9, "enabled": True}
+    assert payload["schema_version"] == config.profile.schema_version
+    assert store.list_profiles() == ["bench"]
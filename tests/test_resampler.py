@@ -14,3 +14,13 @@ def test_rational_resample_downsample():
     iq = np.exp(1j * 2 * np.pi * 0.1 * t)
     out = rational_resample(iq, 2e6, 1e6)
     assert len(out) > 0
+
+
+def test_rational_resample_large_input_matches_complex_filter():
+    from scipy import signal
+
+    iq = np.exp(1j * 0.3 * np.arange(1 << 16)).astype(np.complex64)
+    out = rational_resample(iq, 3e6, 2e6)
+    expected = signal.resample_poly(iq, 2, 3)
+    assert out.dtype == np.complex64
+    assert np.allclose(out, expected, atol=1e-5)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.dsp.spectrum import SpectrumAnalyzer, power_to_db
+
+
+def _tone(freq, sample_rate, size):
+    return np.exp(1j * 2 * np.pi * freq * np.arange(size) / sample_rate).astype(np.complex64)
+
+
+def test_spectrum_peak_tracks_tone():
+    analyzer = SpectrumAnalyzer(sample_rate=1e6, size=1024)
+    result = analyzer.process(_tone(125e3, 1e6, 1024))
+    assert result.freqs.shape == result.magnitude_db.shape == (1024,)
+    assert abs(result.peak_freq - 125e3) < 1e6 / 1024
+    assert result.peak_db == 0.0
+
+
+def test_spectrum_uses_one_sided_bins_for_real_input():
+    analyzer = SpectrumAnalyzer(sample_rate=1e6, size=1024)
+    result = analyzer.process(_tone(125e3, 1e6, 1024).real)
+    assert result.freqs.shape == result.magnitude_db.shape == (513,)
+    assert result.freqs[0] == 0.0
+    assert abs(result.peak_freq - 125e3) < 1e6 / 1024
+
+
+def test_process_frames_batches_consecutive_frames():
+    batched = SpectrumAnalyzer(sample_rate=1e6, size=256, peak_hold=False)
+    serial = SpectrumAnalyzer(sample_rate=1e6, size=256, peak_hold=False)
+    iq = (np.random.default_rng(0).standard_normal(1024) + 1j).astype(np.complex64)
+    for start in range(0, 1024, 256):
+        expected = serial.process(iq[start : start + 256])
+    result = batched.process_frames(iq, max_frames=4)
+    assert np.allclose(result.magnitude_db, expected.magnitude_db, atol=1e-3)
+
+
+def test_short_input_is_zero_padded_to_one_frame():
+    analyzer = SpectrumAnalyzer(sample_rate=1e6, size=1024)
+    result = analyzer.process(_tone(125e3, 1e6, 300))
+    assert result.magnitude_db.shape == (1024,)
+    assert abs(result.peak_freq - 125e3) < 1e6 / 300
+
+
+def test_results_are_snapshots_of_running_buffers():
+    analyzer = SpectrumAnalyzer(sample_rate=1e6, size=256)
+    first = analyzer.process(_tone(100e3, 1e6, 256))
+    before = first.magnitude_db.copy()
+    analyzer.process(_tone(300e3, 1e6, 256))
+    assert np.array_equal(first.magnitude_db, before)
+
+
+def test_power_to_db_matches_log10():
+    power = np.array([1e-30, 1e-3, 1.0, 2.5e4], dtype=np.float32)
+    expected = 10 * np.log10(np.maximum(power.astype(np.float64), 1e-24))
+    assert np.allclose(power_to_db(power.copy()), expected, atol=1e-4)
@@ -0,0 +1,182 @@
+import queue
+import time
+
+import numpy as np
+
+from app.core.events import GLOBAL_BUS, tx_event
+from app.core.types import TxConfig, WaveformSpec
+from app.drivers.pluto_mock import PlutoMockDriver
+from app.services.tx_pipeline import TxPipeline, TxWorker
+
+
+def _spec(iq):
+    return WaveformSpec(
+        name="test",
+        kind="sine",
+        amplitude=1.0,
+        sample_rate=1e6,
+        num_samples=len(iq),
+        crest_factor_db=0.0,
+    )
+
+
+def test_push_waveform_clips_to_safe_amplitude():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    pipeline = TxPipeline(driver)
+    try:
+        iq = np.exp(1j * np.linspace(0, 2 * np.pi, 256)).astype(np.complex64)
+        spec = pipeline.push_waveform("tx1", iq, _spec(iq))
+        assert spec.amplitude == 0.8
+        deadline = time.monotonic() + 2.0
+        while "tx1" not in driver._tx_buffers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sent = driver._tx_buffers["tx1"]
+        assert sent.dtype == np.complex64
+        assert np.isclose(np.abs(sent).max(), 0.8)
+        assert np.isclose(np.abs(iq).max(), 1.0)
+    finally:
+        pipeline.shutdown()
+
+
+def test_push_waveform_keeps_complex64_input_without_copy():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    pipeline = TxPipeline(driver)
+    try:
+        iq = np.full(128, 0.5, dtype=np.complex64)
+        pipeline.push_waveform("tx2", iq, _spec(iq))
+        assert pipeline._last_waveform["tx2"][0] is iq
+    finally:
+        pipeline.shutdown()
+
+
+def _drain_with(coalesce):
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    sent = []
+    driver.start_tx = lambda channel, iq: sent.append(iq)
+    buffers = queue.Queue()
+    buffers.put(np.zeros(4, dtype=np.complex64))
+    buffers.put(np.ones(4, dtype=np.complex64))
+    worker = TxWorker(driver, "tx1", buffers, coalesce=coalesce)
+    worker.start()
+    worker.notify()
+    buffers.join()
+    worker.stop()
+    worker.join(timeout=1.0)
+    return sent
+
+
+def test_tx_worker_coalesces_pending_buffers():
+    latest = _drain_with("latest")
+    assert len(latest) == 1 and np.all(latest[0] == 1)
+    concat = _drain_with("concat")
+    assert len(concat) == 1 and len(concat[0]) == 8
+
+
+def test_tx_worker_acknowledges_buffers_drained_after_stop():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    sent = []
+    driver.start_tx = lambda channel, iq: sent.append(iq)
+    buffers = queue.Queue()
+    buffers.put(np.zeros(4, dtype=np.complex64))
+    worker = TxWorker(driver, "tx1", buffers)
+    drain = worker._drain
+
+    def drain_then_stop():
+        pending = drain()
+        worker.stop()
+        return pending
+
+    worker._drain = drain_then_stop
+    worker.notify()
+    worker.run()
+    assert sent == []
+    assert buffers.unfinished_tasks == 0
+
+
+def test_tx_worker_publishes_running_on_edges_and_heartbeats():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    worker = TxWorker(driver, "tx1", queue.Queue())
+    sequences = []
+
+    def callback(status):
+        sequences.append(status.sequence)
+
+    GLOBAL_BUS.subscribe(tx_event("tx1", "running"), callback)
+    try:
+        for _ in range(20):
+            worker.queue.put(np.zeros(4, dtype=np.complex64))
+            worker._transmit(worker._drain())
+    finally:
+        GLOBAL_BUS.unsubscribe(tx_event("tx1", "running"), callback)
+    assert sequences == [1, 10, 20]
+
+
+def test_tx_worker_publishes_underrun_edges_as_snapshots():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    results = iter([RuntimeError("underrun"), None])
+
+    def start_tx(channel, iq):
+        error = next(results)
+        if error is not None:
+            raise error
+
+    driver.start_tx = start_tx
+    worker = TxWorker(driver, "tx1", queue.Queue())
+    events = []
+    GLOBAL_BUS.subscribe(tx_event("tx1", "running"), events.append)
+    try:
+        for _ in range(2):
+            worker.queue.put(np.zeros(4, dtype=np.complex64))
+            worker._transmit(worker._drain())
+    finally:
+        GLOBAL_BUS.unsubscribe(tx_event("tx1", "running"), events.append)
+    assert [(e.running, e.underrun, e.sequence) for e in events] == [
+        (False, True, 0),
+        (True, False, 1),
+    ]
+    assert all(event is not worker.status for event in events)
+
+
+def test_configure_skips_requeue_for_identical_config():
+    driver = PlutoMockDriver()
+    driver.connect("mock")
+    pipeline = TxPipeline(driver)
+    try:
+        config = TxConfig(
+            channel="tx1", frequency_hz=2.4e9, sample_rate=1e6, bandwidth_hz=2e5, gain_db=-10.0
+        )
+        first = pipeline.configure(config)
+        pipeline._queues["tx1"].join()
+        assert pipeline.configure(config) is first
+        assert pipeline._queues["tx1"].unfinished_tasks == 0
+        pipeline.push_waveform("tx1", np.zeros(8, dtype=np.complex64), first)
+        pipeline._queues["tx1"].join()
+        pipeline.configure(config)
+        pipeline._queues["tx1"].join()
+        assert pipeline._workers["tx1"].status.sequence == 3
+    finally:
+        pipeline.shutdown()
+
+
+def test_push_waveform_pads_to_driver_block_size():
+    class BlockDriver(PlutoMockDriver):
+        def tx_block_size(self, channel):
+            return 16
+
+    driver = BlockDriver()
+    driver.connect("mock")
+    pipeline = TxPipeline(driver)
+    try:
+        iq = np.full(20, 0.5, dtype=np.complex64)
+        spec = pipeline.push_waveform("tx1", iq, _spec(iq))
+        padded = pipeline._last_waveform["tx1"][0]
+        assert spec.num_samples == len(padded) == 32
+        assert np.all(padded[:20] == iq) and not np.any(padded[20:])
+    finally:
+        pipeline.shutdown()
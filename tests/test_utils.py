@@ -0,0 +1,22 @@
+import numpy as np
+
+from app.core.utils import db_to_linear, ensure_safe_amplitude_array, linear_to_db
+
+
+def test_db_conversions_accept_arrays():
+    values = np.array([0.0, 1.0, 10.0], dtype=np.float32)
+    db = linear_to_db(values)
+    assert db.dtype == np.float32
+    assert np.allclose(db, [-240.0, 0.0, 20.0])
+    assert values[0] == 0.0
+    assert np.allclose(db_to_linear(db[1:]), values[1:])
+    assert linear_to_db(10.0) == 20.0
+
+
+def test_ensure_safe_amplitude_array_clamps_in_place():
+    buffer = np.array([0.1, 0.9, 1.5], dtype=np.float32)
+    clamped, clipped = ensure_safe_amplitude_array(buffer, safe_limit=0.8)
+    assert clipped
+    assert clamped is buffer
+    assert np.allclose(buffer, [0.1, 0.8, 0.8])
+    assert ensure_safe_amplitude_array(buffer, safe_limit=0.8)[1] is False
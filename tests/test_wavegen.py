@@ -1,6 +1,14 @@
 import numpy as np
+import pytest
+from scipy import signal
 
-from app.dsp.wavegen import generate_waveform
+from app.dsp.wavegen import (
+    _window,
+    generate_waveform,
+    generate_waveform_chunks,
+    peak_magnitude,
+    window_iq,
+)
 
 
 def test_generate_sine_waveform():
@@ -13,6 +21,43 @@ def test_generate_sine_waveform():
         frequency=100e3,
     )
     assert iq.dtype == np.complex64
+    assert iq.flags.c_contiguous
     assert len(iq) == int(1e6 * 0.001)
     assert spec.name == "test"
     assert spec.crest_factor_db >= 0
+
+
+def test_sine_matches_complex_exponential_over_long_duration():
+    iq, _ = generate_waveform(
+        name="long", kind="sine", sample_rate=1e6, duration_s=1.0, amplitude=0.5, frequency=123e3
+    )
+    t = np.arange(len(iq)) / 1e6
+    expected = 0.5 * np.exp(2j * np.pi * 123e3 * t)
+    assert np.abs(iq - expected).max() < 1e-5
+
+
+def test_window_iq_reuses_window_and_keeps_single_precision():
+    iq = np.ones(64, dtype=np.complex64)
+    windowed = window_iq(iq)
+    assert windowed.dtype == np.complex64
+    assert np.allclose(windowed.real, signal.get_window("hann", 64), atol=1e-6)
+    assert _window("hann", 64) is _window("hann", 64)
+
+
+def test_peak_magnitude_scans_in_chunks():
+    iq = np.zeros(10, dtype=np.complex64)
+    iq[7] = 3 + 4j
+    assert peak_magnitude(iq, chunk=3) == 5.0
+    assert peak_magnitude(np.empty(0, dtype=np.complex64)) == 0.0
+
+
+@pytest.mark.parametrize("kind", ["sine", "square", "chirp", "prbs", "ofdm"])
+def test_waveform_chunks_concatenate_to_full_waveform(kind):
+    np.random.seed(0)
+    full, _ = generate_waveform("full", kind, 1e6, 0.005, 0.5, frequency=12.5e3)
+    np.random.seed(0)
+    chunks = list(
+        generate_waveform_chunks(kind, 1e6, 0.005, 0.5, chunk_samples=777, frequency=12.5e3)
+    )
+    assert max(len(chunk) for chunk in chunks) == 777
+    assert np.array_equal(np.concatenate(chunks), full)